@@ -31,6 +31,10 @@ class AtmosphereController:
         print("[AtmosphereController] Started — monitoring ambient noise...")
 
         self.start_microphone()
+        if self.audio_stream is None:
+            # Nothing to measure, so don't wake up every second to publish 0 dB
+            self.shared.set("noise_level_db", 0)
+            return
 
         while True:
             db_level = self.measure_noise_level()
@@ -0,0 +1,162 @@
+"""
+Camera Service
+Owns the webcam. Grabs every frame once and hands it to the registered vision
+agents, each at its own rate, without going through the shared state lock. Derived images
+(grayscale, RGB, downscaled) are computed on first use and cached on the frame, so
+two agents asking for the same one share the work. Capture keeps running no matter
+which agents come and go.
+"""
+
+import threading
+import time
+
+import cv2
+
+
+class Frame:
+    """One captured frame. Derived images are built lazily and shared by all consumers."""
+
+    def __init__(self, sequence, bgr, small_width):
+        self.sequence = sequence
+        self.timestamp = time.monotonic()
+        self.bgr = bgr
+        self.bgr.flags.writeable = False  # Shared by every consumer, copy it before drawing
+        self.small_width = small_width
+        self._cache = {}
+        self._lock = threading.RLock()  # small_gray is derived from small
+
+    def _derive(self, name, make):
+        with self._lock:
+            if name not in self._cache:
+                self._cache[name] = make()
+            return self._cache[name]
+
+    @property
+    def gray(self):
+        return self._derive("gray", lambda: cv2.cvtColor(self.bgr, cv2.COLOR_BGR2GRAY))
+
+    @property
+    def rgb(self):
+        return self._derive("rgb", lambda: cv2.cvtColor(self.bgr, cv2.COLOR_BGR2RGB))
+
+    @property
+    def scale(self):
+        """Full-size pixels per downscaled pixel, multiply coordinates found on `small` by it."""
+        return max(1.0, self.bgr.shape[1] / self.small_width)
+
+    @property
+    def small(self):
+        def make():
+            if self.scale == 1.0:
+                return self.bgr
+            height, width = self.bgr.shape[:2]
+            size = (self.small_width, round(height * self.small_width / width))
+            return cv2.resize(self.bgr, size, interpolation=cv2.INTER_AREA)
+
+        return self._derive("small", make)
+
+    def gray_at(self, width):
+        """Grayscale frame downscaled to `width` pixels (never enlarged), cached per width."""
+        width = min(width, self.bgr.shape[1])
+
+        def make():
+            if width == self.bgr.shape[1]:
+                return self.gray
+            height = round(self.bgr.shape[0] * width / self.bgr.shape[1])
+            return cv2.resize(self.gray, (width, height), interpolation=cv2.INTER_AREA)
+
+        return self._derive(("gray", width), make)
+
+    @property
+    def small_gray(self):
+        return self._derive("small_gray", lambda: cv2.cvtColor(self.small, cv2.COLOR_BGR2GRAY))
+
+
+class FrameConsumer:
+    """Handle of one registered agent, delivers frames at most `fps` times per second."""
+
+    def __init__(self, camera, name, fps=None):
+        self.camera = camera
+        self.name = name
+        self.interval = 1 / fps if fps else 0
+        self.sequence = 0  # Last frame delivered
+        self.next_due = 0.0
+
+    def next(self, timeout=None):
+        """
+        Block until this consumer is due and there is a frame it has not seen yet.
+        Returns the Frame, or None on a timeout or once the camera has stopped.
+        """
+        wait = self.next_due - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+        frame = self.camera.wait_for_frame(self.sequence, timeout)
+        if frame is None:
+            return None
+
+        self.sequence = frame.sequence
+        self.next_due = time.monotonic() + self.interval
+        return frame
+
+    def set_rate(self, fps):
+        # Takes effect from the next frame on, safe to call from any thread
+        self.interval = 1 / fps if fps else 0
+
+
+class CameraService:
+    SMALL_WIDTH = 320  # Width of the downscaled image, enough for motion checks
+
+    def __init__(self, device=0):
+        self.device = device
+        self.consumers = {}
+        self.current = None  # Newest Frame
+        self.stopped = False
+        self.new_frame = threading.Condition()
+
+    def register(self, name, fps=None):
+        """Register a vision agent; fps=None delivers every frame."""
+        consumer = FrameConsumer(self, name, fps)
+        self.consumers[name] = consumer
+        return consumer
+
+    def run(self):
+        """Main loop: capture frames until the camera fails."""
+        cap = cv2.VideoCapture(self.device)
+        if not cap.isOpened():
+            print("[CameraService] Could not open the webcam — vision agents disabled.")
+            self._stop()
+            return
+
+        print(f"[CameraService] Started — capturing from camera {self.device}...")
+        sequence = 0
+        try:
+            while True:
+                ret, image = cap.read()
+                if not ret:
+                    break
+
+                sequence += 1
+                with self.new_frame:
+                    self.current = Frame(sequence, image, self.SMALL_WIDTH)
+                    self.new_frame.notify_all()
+        finally:
+            cap.release()
+            self._stop()
+            print("[CameraService] Stopped.")
+
+    def wait_for_frame(self, since, timeout=None):
+        # Newest frame if it is newer than `since`, waiting for one if needed
+        with self.new_frame:
+            self.new_frame.wait_for(
+                lambda: self.stopped or (self.current is not None and self.current.sequence > since),
+                timeout,
+            )
+            if self.current is not None and self.current.sequence > since:
+                return self.current
+            return None
+
+    def _stop(self):
+        with self.new_frame:
+            self.stopped = True
+            self.new_frame.notify_all()
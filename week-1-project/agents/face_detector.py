@@ -0,0 +1,98 @@
+"""
+Face Detector
+One Haar cascade pass per frame, shared by PrivacyShield and the PostureGuardian
+fallback. Detection runs on a grayscale frame downscaled only as far as a MIN_FACE
+face still fills the cascade's smallest window (24 px), and the boxes are scaled back
+to full-frame pixels. Between full detections (every DETECT_EVERY frames) the
+known faces are only searched for in a margin around their last position.
+Boxes are published as "face_boxes" in the shared state, largest face first.
+"""
+
+import math
+
+import cv2
+
+
+class FaceDetector:
+    FPS = 10  # Detection passes per second
+    DETECT_EVERY = 5  # Full-frame detection on every Nth pass, tracking in between
+    MIN_FACE = 30  # Smallest face to report, in full-frame pixels
+    CASCADE_WINDOW = 24  # Smallest face the frontal face cascade can match, in pixels
+    ROI_MARGIN = 0.5  # Search margin around a tracked face, as a fraction of its size
+
+    def __init__(self, shared_state, camera):
+        self.shared = shared_state
+        self.frames = camera.register("FaceDetector", fps=self.FPS)
+        self.face_cascade = cv2.CascadeClassifier(
+            cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+        )
+        self.boxes = ()  # Latest published boxes (x, y, w, h) in full-frame pixels
+        self.tracked = []  # Same faces in downscaled pixels, the ROIs for the next pass
+        self.passes = 0
+
+    def run(self):
+        """Main loop: detect faces on every frame the camera hands us."""
+        print("[FaceDetector] Started — detecting faces...")
+
+        while True:
+            frame = self.frames.next()
+            if frame is None:
+                break  # Camera stopped
+
+            gray = frame.gray_at(self.detection_width(frame.bgr.shape[1]))
+            scale = frame.bgr.shape[1] / gray.shape[1]
+
+            if self.passes % self.DETECT_EVERY == 0 or not self.tracked:
+                self.tracked = self.detect(gray, scale)
+            else:
+                self.tracked = self.track(gray, scale)
+            self.passes += 1
+
+            self.publish(tuple(
+                (round(x * scale), round(y * scale), round(w * scale), round(h * scale))
+                for x, y, w, h in self.tracked
+            ))
+
+        self.publish(())
+        print("[FaceDetector] Stopped.")
+
+    def detection_width(self, frame_width):
+        # Narrowest image on which a MIN_FACE face is still at least CASCADE_WINDOW pixels wide
+        return min(frame_width, math.ceil(frame_width * self.CASCADE_WINDOW / self.MIN_FACE))
+
+    def detect(self, gray, scale, offset=(0, 0)):
+        """Run the cascade on a (part of the) downscaled image, boxes in downscaled pixels."""
+        min_size = max(1, round(self.MIN_FACE / scale))
+        faces = self.face_cascade.detectMultiScale(
+            gray, scaleFactor=1.1, minNeighbors=5, minSize=(min_size, min_size)
+        )
+        return [(int(x) + offset[0], int(y) + offset[1], int(w), int(h)) for x, y, w, h in faces]
+
+    def track(self, gray, scale):
+        """Look for every known face only in a window around where it was last seen."""
+        height, width = gray.shape[:2]
+        found = []
+        for x, y, w, h in self.tracked:
+            margin_x, margin_y = int(w * self.ROI_MARGIN), int(h * self.ROI_MARGIN)
+            x0, y0 = max(0, x - margin_x), max(0, y - margin_y)
+            x1, y1 = min(width, x + w + margin_x), min(height, y + h + margin_y)
+            for face in self.detect(gray[y0:y1, x0:x1], scale, offset=(x0, y0)):
+                # Windows of faces close together overlap, don't count the same face twice
+                if not any(self._overlaps(face, other) for other in found):
+                    found.append(face)
+        return found
+
+    def publish(self, boxes):
+        boxes = tuple(sorted(boxes, key=lambda box: box[2] * box[3], reverse=True))
+        self.boxes = boxes
+        if self.shared is not None:
+            self.shared.set("face_boxes", boxes)
+
+    @staticmethod
+    def _overlaps(a, b):
+        # True if the centre of either box lies inside the other one
+        ax, ay, aw, ah = a
+        bx, by, bw, bh = b
+        return (bx <= ax + aw / 2 <= bx + bw and by <= ay + ah / 2 <= by + bh) or (
+            ax <= bx + bw / 2 <= ax + aw and ay <= by + bh / 2 <= ay + ah
+        )
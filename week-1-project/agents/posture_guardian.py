@@ -7,10 +7,14 @@ Detects:
 
 import cv2
 import mediapipe as mp
+import numpy as np
 import time
 import threading
 import pygame
 
+from agents.camera_service import CameraService
+from agents.face_detector import FaceDetector
+
 
 class PostureGuardian:
 
@@ -19,7 +23,16 @@ class PostureGuardian:
     LEAN_THRESHOLD = 0.05
     CLOSE_THRESHOLD = 350
 
-    def __init__(self, shared_state=None):
+    # Pose scheduling: alerts fire at most every CHECK_INTERVAL, so a few checks a
+    # second are plenty, and a still scene does not need a new pose at all
+    TARGET_FPS = 5  # Frames checked per second when plugged in
+    BATTERY_FPS = 2  # ... on battery
+    LOW_BATTERY_FPS = 1  # ... on battery at or below LOW_BATTERY percent
+    LOW_BATTERY = 20
+    MOTION_THRESHOLD = 2.0  # Mean gray level change that counts as movement
+    MAX_SKIP = 2.0  # Seconds a pose result is reused at most while nothing moves
+
+    def __init__(self, shared_state=None, camera=None, faces=None):
 
         self.shared = shared_state
         self.last_alert_time = time.time() + 10
@@ -36,30 +49,46 @@ class PostureGuardian:
             self.mp_drawing = mp.solutions.drawing_utils
             self.pose = self.mp_pose.Pose()
         else:
-            self.face_cascade = cv2.CascadeClassifier(
-                cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-            )
             print("[PostureGuardian] Mediapipe pose not available; using OpenCV fallback.")
 
-        # Camera
-        self.cap = cv2.VideoCapture(0)
+        # Camera, started here when running on its own without main.py
+        if camera is None:
+            camera = CameraService()
+            threading.Thread(target=camera.run, daemon=True).start()
+        self.camera = camera
+        self.frames = camera.register("PostureGuardian", fps=self.TARGET_FPS)
+
+        # Slow down when the laptop runs on battery
+        if shared_state is not None:
+            shared_state.subscribe("is_charging", self.on_power_change)
+            shared_state.subscribe("battery_percent", self.on_power_change)
+            self.on_power_change()
+
+        # Last pose inference, reused while the scene is static
+        self.last_results = None
+        self.last_inference = 0.0
+        self.last_thumbnail = None
+
+        # The fallback reads the boxes of the shared face detector
+        if self.fallback_mode and faces is None:
+            faces = FaceDetector(shared_state, camera)
+            threading.Thread(target=faces.run, daemon=True).start()
+        self.faces = faces
 
     def run(self):
         print("[PostureGuardian] Started — monitoring posture...")
 
-        while self.cap.isOpened():
-
-            ret, frame = self.cap.read()
-            if not ret:
-                break
+        while True:
 
-            if self.shared is not None:
-                self.shared.set("webcam_frame", frame)
+            captured = self.frames.next()
+            if captured is None:
+                break  # Camera stopped
 
+            frame = captured.bgr.copy()  # Own copy to draw on, the captured frame is shared
             current_time = time.time()
 
             if self.fallback_mode:
-                bad, message = self.check_posture_fallback(frame)
+                bad, message = self.check_posture_fallback(self.faces.boxes)
 
                 if bad and (current_time - self.last_alert_time > self.CHECK_INTERVAL):
                     print(f"[PostureGuardian] ⚠ {message}")
@@ -84,8 +113,9 @@ class PostureGuardian:
 
                 continue
 
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.pose.process(rgb_frame)
+            if self.needs_inference(captured):
+                self.last_results = self.pose.process(captured.rgb)
+            results = self.last_results
 
             if results.pose_landmarks:
 
@@ -123,6 +153,35 @@ class PostureGuardian:
 
         self.cleanup()
 
+    def on_power_change(self, *_):
+        """Pick the frame rate for the current power state (also a SharedState subscriber)."""
+        fps = self.TARGET_FPS
+        if not self.shared.get("is_charging"):
+            low = self.shared.get("battery_percent") <= self.LOW_BATTERY
+            fps = self.LOW_BATTERY_FPS if low else self.BATTERY_FPS
+        self.frames.set_rate(fps)
+
+    def needs_inference(self, frame):
+        """
+        Motion gate for pose inference: compare a small thumbnail with the one of the
+        last frame that was processed, and skip the frame if barely anything changed.
+        A result is never reused for longer than MAX_SKIP seconds.
+        """
+        now = time.monotonic()
+        thumbnail = frame.small_gray[::4, ::4].astype(np.int16)
+
+        if (
+            self.last_results is not None
+            and now - self.last_inference < self.MAX_SKIP
+            and self.last_thumbnail.shape == thumbnail.shape
+            and np.abs(thumbnail - self.last_thumbnail).mean() < self.MOTION_THRESHOLD
+        ):
+            return False
+
+        self.last_thumbnail = thumbnail
+        self.last_inference = now
+        return True
+
     def check_posture(self, landmarks, frame_width):
 
         left = landmarks[self.mp_pose.PoseLandmark.LEFT_SHOULDER]
@@ -147,20 +206,12 @@ class PostureGuardian:
 
         return False, ""
 
-    def check_posture_fallback(self, frame):
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        faces = self.face_cascade.detectMultiScale(
-            gray,
-            scaleFactor=1.1,
-            minNeighbors=5,
-            minSize=(60, 60)
-        )
-
+    def check_posture_fallback(self, faces):
         if len(faces) == 0:
             return False, ""
 
-        # Largest face approximates nearest distance to camera.
-        _, _, face_width, _ = max(faces, key=lambda face: face[2] * face[3])
+        # Largest face (listed first) approximates nearest distance to camera.
+        _, _, face_width, _ = faces[0]
 
         if face_width > 320:
             return True, "Too close! Move back."
@@ -174,6 +225,5 @@ class PostureGuardian:
         ).start()
 
     def cleanup(self):
-        self.cap.release()
         cv2.destroyAllWindows()
         print("[PostureGuardian] Stopped.")
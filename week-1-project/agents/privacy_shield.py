@@ -5,8 +5,6 @@ If more than 1 face is detected, applies a blur overlay using tkinter
 and minimizes all windows. Restores when the stranger leaves.
 """
 
-import time
-import cv2
 import threading
 
 try:
@@ -23,9 +21,6 @@ except ImportError:
 class PrivacyShield:
     def __init__(self, shared_state):
         self.shared = shared_state
-        self.face_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-        )
         self.blur_window = None
         self.blur_active = False
         self.minimized_windows = []
@@ -34,32 +29,22 @@ class PrivacyShield:
         """Main loop: continuously check for background faces."""
         print("[PrivacyShield] Started — scanning for unauthorized viewers...")
 
+        version = 0
         while True:
-            frame = self.shared.get("webcam_frame")
-
-            if frame is not None:
-                num_faces = self.count_faces(frame)
-
-                if num_faces > 1:
-                    if not self.shared.get("screen_blurred"):
-                        print(f"[PrivacyShield] ⚠ {num_faces} faces detected! Activating privacy mode...")
-                        self.shared.set("background_face_detected", True)
-                        self.blur_screen()
-                else:
-                    if self.shared.get("screen_blurred"):
-                        print("[PrivacyShield] ✓ Stranger left. Restoring screen...")
-                        self.shared.set("background_face_detected", False)
-                        self.restore_screen()
-
-            time.sleep(0.5)
-
-    def count_faces(self, frame):
-        """Detect all faces in the frame and return the count."""
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        faces = self.face_cascade.detectMultiScale(
-            gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
-        )
-        return len(faces)
+            # Faces come from the shared FaceDetector, sleep until they change
+            faces, version = self.shared.wait_for_change("face_boxes", since=version)
+            num_faces = len(faces)
+
+            if num_faces > 1:
+                if not self.shared.get("screen_blurred"):
+                    print(f"[PrivacyShield] ⚠ {num_faces} faces detected! Activating privacy mode...")
+                    self.shared.set("background_face_detected", True)
+                    self.blur_screen()
+            else:
+                if self.shared.get("screen_blurred"):
+                    print("[PrivacyShield] ✓ Stranger left. Restoring screen...")
+                    self.shared.set("background_face_detected", False)
+                    self.restore_screen()
 
     def blur_screen(self):
         """Minimize all windows and create a blur overlay using tkinter."""
@@ -3,10 +3,18 @@ from agents import power_optimizer
 from agents import atmosphere_controller
 from agents import privacy_shield
 from agents import posture_guardian
+from agents import camera_service
+from agents import face_detector
 import shared_state
 import threading
 import time
 
+# Keys whose changes trigger a status line; the noise level and distraction timer
+# tick constantly, so they only show up in the periodic line
+STATUS_KEYS = ("battery_percent", "is_charging", "active_window", "app_blocked", "screen_blurred", "white_noise_playing")
+STATUS_INTERVAL = 5  # Seconds between status lines when nothing changes
+STATUS_MIN_INTERVAL = 1  # Seconds between status lines at least
+
 
 def main():
     print("Starting Deep Work Guardian...\n")
@@ -16,10 +24,14 @@ def main():
     distraction = distraction_blocker.DistractionBlocker(shared)
     power = power_optimizer.PowerOptimizer(shared)
     atmosphere = atmosphere_controller.AtmosphereController(shared)
+    camera = camera_service.CameraService()
+    faces = face_detector.FaceDetector(shared, camera)
     privacy = privacy_shield.PrivacyShield(shared)
-    posture =posture_guardian.PostureGuardian(shared)
+    posture =posture_guardian.PostureGuardian(shared, camera, faces)
 
     threads = [
+        threading.Thread(target=camera.run, daemon=True),
+        threading.Thread(target=faces.run, daemon=True),
         threading.Thread(target=power.run, daemon=True),
         threading.Thread(target=distraction.run, daemon=True),
         threading.Thread(target=atmosphere.run, daemon=True),
@@ -34,6 +46,7 @@ def main():
     print("Press Ctrl+C to stop\n")
 
     try:
+        version = shared.wait_for_any(STATUS_KEYS, timeout=0)  # Current version, returns at once
         while True:
             status = shared.get_all()
             print(
@@ -42,7 +55,11 @@ def main():
                 f" | Distraction: {status['distraction_timer']}s"
                 f" | Noise: {status['noise_level_db']}dB"
             )
-            time.sleep(5)
+            # Print again as soon as something worth showing changes, at least every STATUS_INTERVAL
+            time.sleep(STATUS_MIN_INTERVAL)
+            version = shared.wait_for_any(
+                STATUS_KEYS, timeout=STATUS_INTERVAL - STATUS_MIN_INTERVAL, since=version
+            )
     except KeyboardInterrupt:
         print("\nGoodbye!")
 
@@ -1,9 +1,19 @@
 import threading
 
 
+def _unchanged(old, new):
+    """True if setting `new` over `old` is not a change worth waking anyone for."""
+    if old is new:
+        return True
+    # Only plain values are compared, anything else counts as changed unless it is the same object
+    plain = (bool, int, float, str, tuple, type(None))
+    return isinstance(old, plain) and isinstance(new, plain) and old == new
+
+
 class SharedState:
     def __init__(self):
         self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)  # Notified on every change
         self.data = {
             # Ergonomics
             "face_distance_cm": 100,
@@ -11,6 +21,7 @@ class SharedState:
             # Privacy
             "background_face_detected": False,  # True if a face is detected in the background
             "screen_blurred": False,  # True if the screen is blurred
+            "face_boxes": (),  # (x, y, w, h) of every face in the webcam frame, largest first
             # Backgournd Noise
             "noise_level_db": 0,
             "white_noise_playing": False,
@@ -22,18 +33,67 @@ class SharedState:
             "active_window": "",  # Title of the active window
             "distraction_timer": 0,  # Time in seconds the user has been distracted
             "app_blocked": False,  # True if the app is blocked
-            # Shared webcam
-            "webcam_frame": None,
         }
+        self.versions = {key: 0 for key in self.data}  # Bumped every time a value changes
+        self.subscribers = {key: [] for key in self.data}
 
     def get(self, key):
         with self.lock:
             return self.data[key]
 
     def set(self, key, value):
+        """
+        Store a value. If it differs from the old one, the key's version is bumped,
+        every thread waiting on it wakes up and the subscribers of the key are called
+        (outside the lock, in the setting thread) as callback(key, value, old_value).
+        """
         with self.lock:
+            old = self.data[key]
             self.data[key] = value
+            if _unchanged(old, value):
+                return
+            self.versions[key] += 1
+            self.changed.notify_all()
+            callbacks = list(self.subscribers[key])
+
+        for callback in callbacks:
+            callback(key, value, old)
 
     def get_all(self):
         with self.lock:
             return self.data.copy()
+
+    def version(self, key):
+        with self.lock:
+            return self.versions[key]
+
+    def wait_for_change(self, key, timeout=None, since=None):
+        """
+        Block until `key` has changed since version `since` (by default: since now),
+        or until timeout seconds have passed. Returns (value, version); on a timeout
+        the version is still `since`.
+        """
+        with self.lock:
+            if since is None:
+                since = self.versions[key]
+            self.changed.wait_for(lambda: self.versions[key] != since, timeout)
+            return self.data[key], self.versions[key]
+
+    def wait_for_any(self, keys, timeout=None, since=None):
+        """
+        Like wait_for_change for several keys at once. The returned version is the
+        sum of the keys' versions, pass it back as `since` to wait for the next change.
+        """
+        with self.lock:
+            if since is None:
+                since = sum(self.versions[key] for key in keys)
+            self.changed.wait_for(lambda: sum(self.versions[key] for key in keys) != since, timeout)
+            return sum(self.versions[key] for key in keys)
+
+    def subscribe(self, key, callback):
+        with self.lock:
+            self.subscribers[key].append(callback)
+
+    def unsubscribe(self, key, callback):
+        with self.lock:
+            self.subscribers[key].remove(callback)
@@ -1,94 +1,49 @@
 """
-Task E — Vacuum World: Breadth-First Search (BFS)
+Task E — Vacuum World: BFS, UCS and A* with a tkinter GUI
 Costs: UP=2  DOWN=0  LEFT=1  RIGHT=1
+The search lives in vacuum_core.py; this file is only the optional GUI frontend.
+Headless runs: python vacuum_cli.py --episodes 1000
 """
-import tkinter as tk, random, threading
-from collections import deque
-
-# ── Constants ──────────────────────────────────────────────────
-ROWS, COLS = 6, 6
-EMPTY, OBSTACLE, DIRT, VACUUM = 0, 1, 2, 3
-MOVES = {"UP":((-1,0),2), "DOWN":((1,0),0), "LEFT":((0,-1),1), "RIGHT":((0,1),1)}
-
-# ── Step 1: Generate random board ──────────────────────────────
-def generate_board():
-    board = [[EMPTY]*COLS for _ in range(ROWS)]
-    cells = [(r,c) for r in range(ROWS) for c in range(COLS)]
-    random.shuffle(cells)
-    vp = cells.pop(); board[vp[0]][vp[1]] = VACUUM
-    dp = cells.pop(); board[dp[0]][dp[1]] = DIRT
-    for _ in range(random.randint(5,10)):
-        if cells: r,c = cells.pop(); board[r][c] = OBSTACLE
-    return board, vp, dp
-
-# ── Step 2: BFS algorithm ──────────────────────────────────────
-def bfs_solve(board, start, goal):
-    queue   = deque([start])
-    visited = {start: (None, None, 0)}  # pos -> (parent, move, cost)
-    while queue:
-        pos = queue.popleft()
-        if pos == goal:                 # goal reached — rebuild path
-            path, cur = [], pos
-            while visited[cur][1]:
-                parent, move, _ = visited[cur]
-                path.append((move, cur)); cur = parent
-            return list(reversed(path)), visited[goal][2]
-        r, c = pos
-        for move, ((dr,dc), mc) in MOVES.items():
-            npos = (r+dr, c+dc)
-            if (0<=npos[0]<ROWS and 0<=npos[1]<COLS
-                    and board[npos[0]][npos[1]] != OBSTACLE
-                    and npos not in visited):
-                visited[npos] = (pos, move, visited[pos][2]+mc)
-                queue.append(npos)
-    return None, None                   # no solution
-
-# ── Step 3: Write solution.txt ─────────────────────────────────
-def write_file(board, start, goal, path, cost):
-    SYM = {EMPTY:".", OBSTACLE:"#", DIRT:"D", VACUUM:"V"}
-    def draw(vp):
-        return "\n".join(" ".join("V" if (r,c)==vp else SYM[board[r][c]]
-                                  for c in range(COLS)) for r in range(ROWS))
-    with open("solution.txt","w",encoding="utf-8") as f:
-        f.write(f"VACUUM WORLD — BFS\nGrid:{ROWS}x{COLS}  Vacuum:{start}  Dirt:{goal}\n")
-        f.write("Costs: UP=2 DOWN=0 LEFT=1 RIGHT=1\nLegend: V=Vacuum D=Dirt #=Obstacle .=Empty\n\n")
-        f.write("INITIAL BOARD:\n" + draw(start) + "\n\n")
-        if path is None:
-            f.write("NO SOLUTION — there is no solution because of obstacles.\n")
-            f.write("The dirt cannot be reached. Board at time of failure:\n\n")
-            f.write(draw(start) + "\n"); return
-        total = 0
-        for i,(move,npos) in enumerate(path,1):
-            total += MOVES[move][1]
-            f.write(f"Step {i}: {move} -> {npos}  (+{MOVES[move][1]}, total={total})\n")
-            f.write(draw(npos)+"\n\n")
-        f.write(f"GOAL REACHED!  Steps:{len(path)}  Total Cost:{cost}\n")
+import threading, sys
+import numpy as np
+from vacuum_core import (ROWS, COLS, EMPTY, OBSTACLE, DIRT, VACUUM, MOVES, SOLVERS,
+                         generate_board, bfs_solve, bidirectional_bfs_solve, ucs_solve,
+                         astar_solve, plan_route, distance_field, write_file, benchmark)
+try:
+    import tkinter as tk                # Optional, only needed for the GUI
+except ImportError:
+    tk = None
 
 # ── Step 4: GUI ────────────────────────────────────────────────
-CELL = 90; PAD = 20
+CELL = 90; PAD = 20; VIEW = 720        # max cell size, border, max grid size in pixels
 C = {"bg":"#0d0d1a","cell":"#16213e","obs":"#2a1a10",
      "vac":"#00E5FF","dirt":"#FFD700","goal":"#00FF88","panel":"#0a1628"}
 
 class App:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Task E — Vacuum BFS")
+    """Canvas items are created once per board (draw_board); playback only moves the
+    vacuum marker and hides cleaned dirt, so a step costs O(1) canvas work on any grid."""
+    def __init__(self, root, rows=ROWS, cols=COLS, dirt=1):
+        self.root = root; self.rows, self.cols, self.dirt = rows, cols, dirt
+        self.cell = max(3, min(CELL, VIEW // max(rows, cols)))
+        self.root.title("Task E — Vacuum Search")
         self.root.configure(bg=C["bg"])
         self._build_ui()
         self._new_game()
 
     def _build_ui(self):
-        tk.Label(self.root, text="VACUUM WORLD — BFS", font=("Courier New",16,"bold"),
+        tk.Label(self.root, text="VACUUM WORLD — SEARCH", font=("Courier New",16,"bold"),
                  bg=C["bg"], fg=C["vac"]).pack(pady=8)
         main = tk.Frame(self.root, bg=C["bg"]); main.pack(padx=16)
-        self.canvas = tk.Canvas(main, width=COLS*CELL+PAD*2, height=ROWS*CELL+PAD*2,
+        self.canvas = tk.Canvas(main, width=self.cols*self.cell+PAD*2, height=self.rows*self.cell+PAD*2,
                                 bg=C["bg"], highlightthickness=1, highlightbackground=C["vac"])
         self.canvas.pack(side="left", padx=(0,16))
         p = tk.Frame(main, bg=C["panel"], width=220, padx=10, pady=10)
         p.pack(side="left", fill="y"); p.pack_propagate(False)
-        tk.Label(p, text="BFS INFO", font=("Courier New",13,"bold"),
+        tk.Label(p, text="SEARCH INFO", font=("Courier New",13,"bold"),
                  bg=C["panel"], fg=C["vac"]).pack(pady=(4,8))
-        self.lbl = {k: self._row(p,k,"...") for k in ["Status","Step","Move","Cost","Total"]}
+        self.algo = tk.StringVar(value="BFS")
+        tk.OptionMenu(p, self.algo, *SOLVERS, command=lambda _: self._resolve()).pack(fill="x", pady=(0,6))
+        self.lbl = {k: self._row(p,k,"...") for k in ["Status","Step","Move","Cost","Total","Nodes"]}
         tk.Label(p, text="\nMove Costs:\n^ UP=2  v DOWN=0\n< LEFT=1  > RIGHT=1",
                  font=("Courier New",9), bg=C["panel"], fg="#888").pack(anchor="w")
         self.btn = tk.Button(p, text="▶ PLAY", font=("Courier New",11,"bold"),
@@ -98,8 +53,8 @@ class App:
         tk.Button(p, text="↺ NEW", font=("Courier New",11,"bold"),
                   bg="#0a3a2a", fg="white", relief="flat", pady=6,
                   command=self._new_game).pack(fill="x")
-        self.speed = tk.IntVar(value=600)
-        tk.Scale(p, variable=self.speed, from_=100, to=2000, orient="horizontal",
+        self.speed = tk.IntVar(value=600 if self.cell >= 30 else 10)
+        tk.Scale(p, variable=self.speed, from_=10, to=2000, orient="horizontal",
                  bg=C["panel"], fg="white", highlightthickness=0, length=190,
                  label="ms/step").pack(pady=8)
         self.bar = tk.Label(self.root, text="", font=("Courier New",10),
@@ -115,22 +70,30 @@ class App:
         return v
 
     def _new_game(self):
-        if hasattr(self,"_aid") and self._aid: self.root.after_cancel(self._aid)
-        self.board, self.vpos, self.dpos = generate_board()
+        self.board, self.vpos, self.dpos = generate_board(self.rows, self.cols, self.dirt)
+        self.draw_board()
+        self._resolve()
+
+    def _resolve(self):                 # (re)solve the current board with the selected algorithm
+        if getattr(self,"_aid",None): self.root.after_cancel(self._aid); self._aid = None
         self.path = self.cost = None; self.step = 0
-        for k,v in [("Status","Computing..."),("Step","0"),("Move","-"),("Cost","0"),("Total","?")]:
-            self.lbl[k].config(text=v)
+        for k,v in [("Status","Computing..."),("Step","0"),("Move","-"),("Cost","0"),("Total","?"),("Nodes","?")]:
+            self.lbl[k].config(text=v, fg="white")
         self.btn.config(state="disabled")
-        self.bar.config(text="Running BFS...")
-        self.draw(self.vpos)
-        threading.Thread(target=self._solve, daemon=True).start()
+        self.bar.config(text=f"Running {self.algo.get()}...")
+        self.reset_board()
+        threading.Thread(target=self._solve, args=(self.algo.get(),), daemon=True).start()
 
-    def _solve(self):
-        self.path, self.cost = bfs_solve(self.board, self.vpos, self.dpos)
-        write_file(self.board, self.vpos, self.dpos, self.path, self.cost)
+    def _solve(self, algo):
+        stats = {}                      # several dirt cells are always planned by bfs_solve/plan_route
+        solver = bfs_solve if isinstance(self.dpos, list) else SOLVERS[algo]
+        self.path, self.cost = solver(self.board, self.vpos, self.dpos, stats=stats)
+        self.nodes = stats["expanded"]
+        write_file(self.board, self.vpos, self.dpos, self.path, self.cost, algo)
         self.root.after(0, self._done)
 
     def _done(self):
+        self.lbl["Nodes"].config(text=str(self.nodes))
         if self.path is None:
             self.lbl["Status"].config(text="NO SOLUTION", fg="red")
             self.bar.config(text="No solution — dirt blocked. See solution.txt")
@@ -141,38 +104,76 @@ class App:
             self.btn.config(state="normal")
 
     def _play(self):
-        self.step = 0; self.btn.config(state="disabled")
-        self.draw(self.vpos); self._tick()
+        self.step = 0; self.run_cost = 0; self.btn.config(state="disabled")
+        self.reset_board(); self._tick()
 
     def _tick(self):
         if self.step >= len(self.path):
             self.lbl["Status"].config(text="GOAL ★", fg=C["goal"])
             self.bar.config(text=f"Goal reached! Cost={self.cost}")
-            self.draw(self.path[-1][1], done=True)
+            self.move_vacuum(self.path[-1][1], done=True)
             self.btn.config(state="normal"); return
         move, npos = self.path[self.step]; self.step += 1
-        rc = sum(MOVES[m][1] for m,_ in self.path[:self.step])
+        self.run_cost += MOVES[move][1]  # running prefix sum, O(1) per step
         self.lbl["Step"].config(text=f"{self.step}/{len(self.path)}")
         self.lbl["Move"].config(text=move)
-        self.lbl["Cost"].config(text=str(rc))
-        self.bar.config(text=f"Step {self.step}: {move} -> {npos}  cost so far: {rc}")
-        self.draw(npos)
+        self.lbl["Cost"].config(text=str(self.run_cost))
+        self.bar.config(text=f"Step {self.step}: {move} -> {npos}  cost so far: {self.run_cost}")
+        self.move_vacuum(npos)
         self._aid = self.root.after(self.speed.get(), self._tick)
 
-    def draw(self, vpos, done=False):
-        self.canvas.delete("all")
-        for r in range(ROWS):
-            for c in range(COLS):
-                x, y   = PAD+c*CELL, PAD+r*CELL
-                cx, cy = x+CELL//2, y+CELL//2
-                tile   = self.board[r][c]
-                self.canvas.create_rectangle(x+2,y+2,x+CELL-2,y+CELL-2,
-                    fill=C["obs"] if tile==OBSTACLE else C["cell"], outline="#1a2a4a")
-                if   (r,c)==vpos:      self.canvas.create_text(cx,cy,text="★" if done else "●",
-                                           fill=C["goal"] if done else C["vac"],font=("Courier New",28,"bold"))
-                elif tile==DIRT:       self.canvas.create_text(cx,cy,text="◆",fill=C["dirt"],font=("Courier New",26,"bold"))
-                elif tile==OBSTACLE:   self.canvas.create_text(cx,cy,text="▓",fill="#5a3a2a",font=("Courier New",28,"bold"))
+    def _box(self, r, c, inset):
+        x, y = PAD+c*self.cell, PAD+r*self.cell
+        return x+inset, y+inset, x+self.cell-inset, y+self.cell-inset
+
+    def draw_board(self):
+        """Create every canvas item for the current board, once. Big cells get the framed tiles
+        and glyphs; small cells (large grids) only get coloured squares on one background."""
+        cv, n, big = self.canvas, self.cell, self.cell >= 30
+        cv.delete("all"); self.dirt_items = {}
+        cv.create_rectangle(PAD, PAD, PAD+self.cols*n, PAD+self.rows*n, fill=C["cell"], outline="")
+        cells = (((r, c) for r in range(self.rows) for c in range(self.cols)) if big
+                 else zip(*np.nonzero(self.board != EMPTY)))   # empty cells are the background
+        for r, c in cells:
+            r, c = int(r), int(c); tile = self.board[r][c]
+            x0, y0, x1, y1 = self._box(r, c, 2 if big else 0)
+            if big:
+                cv.create_rectangle(x0, y0, x1, y1, fill=C["obs"] if tile==OBSTACLE else C["cell"], outline="#1a2a4a")
+            cx, cy = (x0+x1)//2, (y0+y1)//2
+            if tile == OBSTACLE:
+                if big: cv.create_text(cx,cy,text="▓",fill="#5a3a2a",font=("Courier New",28,"bold"))
+                else:   cv.create_rectangle(x0, y0, x1, y1, fill="#5a3a2a", outline="")
+            elif tile == DIRT:
+                self.dirt_items[(r, c)] = (cv.create_text(cx,cy,text="◆",fill=C["dirt"],font=("Courier New",26,"bold"))
+                                           if big else cv.create_rectangle(x0, y0, x1, y1, fill=C["dirt"], outline=""))
+        x0, y0, x1, y1 = self._box(*self.vpos, 2 if big else 0)
+        self.vac = (cv.create_text((x0+x1)//2,(y0+y1)//2,text="●",fill=C["vac"],font=("Courier New",28,"bold"))
+                    if big else cv.create_oval(x0, y0, x1, y1, fill=C["vac"], outline=""))
+
+    def reset_board(self):              # back to the initial position without recreating items
+        for item in self.dirt_items.values(): self.canvas.itemconfig(item, state="normal")
+        self.move_vacuum(self.vpos)
+
+    def move_vacuum(self, pos, done=False):
+        x0, y0, x1, y1 = self._box(*pos, 2 if self.cell >= 30 else 0)
+        if self.cell >= 30:
+            self.canvas.coords(self.vac, (x0+x1)//2, (y0+y1)//2)
+            self.canvas.itemconfig(self.vac, text="★" if done else "●", fill=C["goal"] if done else C["vac"])
+        else:
+            self.canvas.coords(self.vac, x0, y0, x1, y1)
+            self.canvas.itemconfig(self.vac, fill=C["goal"] if done else C["vac"])
+        if pos in self.dirt_items: self.canvas.itemconfig(self.dirt_items[pos], state="hidden")
+        self.canvas.tag_raise(self.vac)
 
 # ── Run ────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    root = tk.Tk(); App(root); root.mainloop()
+    if "--benchmark" in sys.argv:       # python task_e.py --benchmark [N]
+        i = sys.argv.index("--benchmark")
+        benchmark(int(sys.argv[i+1]) if len(sys.argv) > i+1 else 500)
+    elif tk is None:
+        sys.exit("tkinter is not available — use vacuum_cli.py for headless runs")
+    else:                               # python task_e.py [--size 100x100] [--dirt 5]
+        size = sys.argv[sys.argv.index("--size")+1] if "--size" in sys.argv else f"{ROWS}x{COLS}"
+        dirt = int(sys.argv[sys.argv.index("--dirt")+1]) if "--dirt" in sys.argv else 1
+        rows, cols = map(int, size.lower().split("x"))
+        root = tk.Tk(); App(root, rows, cols, dirt); root.mainloop()
@@ -0,0 +1,55 @@
+"""
+Vacuum World — replay a compact trace (written by write_file for boards above 20x20,
+or with fmt="trace").
+
+    python trace_replay.py solution.txt                     # summary
+    python trace_replay.py solution.txt --step 120          # board after step 120
+    python trace_replay.py solution.txt --step 120 --window 15
+    python trace_replay.py solution.txt --verbose full.txt  # expand to the full-board format
+"""
+import argparse, os
+from vacuum_core import (EMPTY, DIRT, VACUUM, MOVE_OF, SYM, read_trace, trace_positions, write_file)
+
+def board_at(trace, positions, step):
+    """Board after `step` moves: vacuum at its position, dirt it has passed over cleaned."""
+    board = trace["board"].copy()
+    board[board == VACUUM] = EMPTY
+    for r, c in map(tuple, positions[:step+1].tolist()):
+        if board[r, c] == DIRT: board[r, c] = EMPTY
+    r, c = positions[step]; board[r, c] = VACUUM
+    return board
+
+def render(board, centre=None, window=None):
+    rows, cols = board.shape
+    r0, c0, r1, c1 = 0, 0, rows, cols
+    if window:                          # only the window x window cells around the vacuum
+        r0, c0 = max(0, centre[0]-window//2), max(0, centre[1]-window//2)
+        r1, c1 = min(rows, r0+window), min(cols, c0+window)
+    return "\n".join(" ".join(SYM[int(t)] for t in board[r, c0:c1]) for r in range(r0, r1))
+
+def main():
+    ap = argparse.ArgumentParser(description="Replay a vacuum world trace")
+    ap.add_argument("trace"); ap.add_argument("--step", type=int, help="Show the board after this many moves")
+    ap.add_argument("--window", type=int, help="Only show this many rows/columns around the vacuum")
+    ap.add_argument("--verbose", metavar="FILE", help="Write the full-board format to FILE")
+    a = ap.parse_args()
+
+    t = read_trace(a.trace); pos = trace_positions(t)
+    rows, cols = t["board"].shape
+    print(f"{t['algo']}  grid {rows}x{cols}  vacuum {t['start']}  dirt cells {len(t['dirt'])}  "
+          f"steps {t['steps']}  cost {t['cost']}  ({os.path.getsize(a.trace):,} bytes)")
+    if a.step is not None:
+        step = max(0, min(a.step, len(t["moves"])))
+        cost = int(t["deltas"][:step].sum())
+        move = MOVE_OF[t["moves"][step-1]] if step else "-"
+        print(f"Step {step}: {move} -> {tuple(pos[step].tolist())}  total={cost}")
+        print(render(board_at(t, pos, step), pos[step], a.window))
+    if a.verbose:
+        path = None if t["steps"] is None else \
+            [(MOVE_OF[m], tuple(p)) for m, p in zip(t["moves"], pos[1:].tolist())]
+        goal = t["dirt"][0] if len(t["dirt"]) == 1 else t["dirt"]
+        write_file(t["board"], t["start"], goal, path, t["cost"], t["algo"], a.verbose, fmt="verbose")
+        print(f"Wrote {a.verbose}")
+
+if __name__ == "__main__":
+    main()
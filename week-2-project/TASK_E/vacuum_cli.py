@@ -0,0 +1,72 @@
+"""
+Vacuum World — headless batch runs (no tkinter needed).
+Runs N seeded episodes across worker processes and prints aggregate stats:
+
+    python vacuum_cli.py --episodes 1000 --rows 50 --cols 50 --density 0.2 --solver astar
+    python vacuum_cli.py --episodes 200 --rows 200 --cols 200 --dirt 20 --csv runs.csv --json stats.json
+
+Episode i uses seed --seed + i, so any episode can be re-run on its own.
+With --dirt above 1 every episode is planned with plan_route, whatever --solver says.
+"""
+import argparse, csv, json, os, random, sys, time
+from concurrent.futures import ProcessPoolExecutor
+from vacuum_core import bfs_solve, ucs_solve, astar_solve, generate_board, benchmark
+
+SOLVERS = {
+    "bfs":           lambda b, v, d, st: bfs_solve(b, v, d, stats=st),
+    "bidirectional": lambda b, v, d, st: bfs_solve(b, v, d, bidirectional=True, stats=st),
+    "ucs":           lambda b, v, d, st: ucs_solve(b, v, d, stats=st),
+    "astar":         lambda b, v, d, st: astar_solve(b, v, d, stats=st),
+}
+FIELDS = ["seed", "solved", "cost", "steps", "nodes", "time_ms"]
+
+def run_episode(task):
+    """One episode in a worker process: generate the seeded board, solve it, return a CSV row."""
+    seed, rows, cols, dirt, density, solver = task
+    board, vp, dp = generate_board(rows, cols, dirt, density, random.Random(seed))
+    stats, start = {}, time.perf_counter()
+    path, cost = bfs_solve(board, vp, dp, stats=stats) if dirt > 1 else SOLVERS[solver](board, vp, dp, stats)
+    return {"seed": seed, "solved": path is not None, "cost": cost,
+            "steps": len(path) if path is not None else None, "nodes": stats["expanded"],
+            "time_ms": round((time.perf_counter()-start)*1000, 3)}
+
+def aggregate(rows):
+    solved = [r for r in rows if r["solved"]]
+    mean = lambda k, rs: round(sum(r[k] for r in rs)/len(rs), 3) if rs else None
+    return {"episodes": len(rows), "solved": len(solved),
+            "solve_rate": round(len(solved)/len(rows), 4) if rows else None,
+            "mean_cost": mean("cost", solved), "mean_steps": mean("steps", solved),
+            "mean_nodes": mean("nodes", rows), "mean_time_ms": mean("time_ms", rows)}
+
+def main():
+    ap = argparse.ArgumentParser(description="Run seeded vacuum world episodes in parallel")
+    ap.add_argument("--episodes", type=int, default=100)
+    ap.add_argument("--seed", type=int, default=0, help="Seed of the first episode")
+    ap.add_argument("--rows", type=int, default=6); ap.add_argument("--cols", type=int, default=6)
+    ap.add_argument("--dirt", type=int, default=1, help="Dirt cells per board")
+    ap.add_argument("--density", type=float, default=None, help="Share of obstacle cells (default 5-10 per 36)")
+    ap.add_argument("--solver", choices=SOLVERS, default="bfs")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--csv", metavar="FILE", help="Write one row per episode")
+    ap.add_argument("--json", metavar="FILE", help="Write aggregate stats and all episodes")
+    ap.add_argument("--benchmark", type=int, metavar="N", help="Only run the solver cross-check on N 6x6 boards")
+    a = ap.parse_args()
+    if a.benchmark: benchmark(a.benchmark); return
+
+    tasks = [(a.seed+i, a.rows, a.cols, a.dirt, a.density, a.solver) for i in range(a.episodes)]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(a.workers) as pool:
+        rows = list(pool.map(run_episode, tasks, chunksize=max(1, len(tasks)//(a.workers*4))))
+    summary = dict(aggregate(rows), wall_s=round(time.perf_counter()-start, 3), workers=a.workers,
+                   grid=f"{a.rows}x{a.cols}", dirt=a.dirt, density=a.density,
+                   solver="plan_route" if a.dirt > 1 else a.solver)
+
+    if a.csv:
+        with open(a.csv, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, FIELDS); w.writeheader(); w.writerows(rows)
+    if a.json:
+        with open(a.json, "w", encoding="utf-8") as f: json.dump({"summary": summary, "episodes": rows}, f, indent=2)
+    json.dump(summary, sys.stdout, indent=2); print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+Vacuum World core — board generation, search and solution files, no GUI.
+Costs: UP=2  DOWN=0  LEFT=1  RIGHT=1
+BFS finds the fewest steps; UCS and A* find the cheapest path. With these costs a
+path costs its step count + (rows up − rows down), and the second term is fixed by
+start and goal, so all three agree on cost here; UCS/A* stay optimal for any
+non-negative MOVES costs.
+Boards are NumPy uint8 grids of any size; give bfs_solve a list of dirt cells and
+plan_route visits them all.
+Used by task_e.py (tkinter GUI), vacuum_cli.py (headless batch runs) and trace_replay.py.
+"""
+import random, heapq, re
+import numpy as np
+from collections import deque
+
+# ── Constants ──────────────────────────────────────────────────
+ROWS, COLS = 6, 6                       # default grid size (GUI)
+EMPTY, OBSTACLE, DIRT, VACUUM = 0, 1, 2, 3
+MOVES = {"UP":((-1,0),2), "DOWN":((1,0),0), "LEFT":((0,-1),1), "RIGHT":((0,1),1)}
+
+# ── Step 1: Generate random board ──────────────────────────────
+def generate_board(rows=ROWS, cols=COLS, dirt=1, density=None, rng=random):
+    """rows x cols NumPy grid with the vacuum, `dirt` dirt cells and density·cells obstacles
+    (default 5-10 per 36 cells, like the original 6x6 board).
+    Returns (board, vacuum, dirt): dirt is one (r,c) if dirt == 1, else a list of cells."""
+    n = rows*cols
+    walls = round(density*n) if density is not None else rng.randint(5,10)*n//36
+    cells = rng.sample(range(n), min(n, 1+dirt+walls))
+    board = np.zeros((rows, cols), np.uint8); flat = board.reshape(-1)
+    flat[cells[1+dirt:]] = OBSTACLE; flat[cells[1:1+dirt]] = DIRT; flat[cells[0]] = VACUUM
+    dirts = [divmod(i, cols) for i in cells[1:1+dirt]]
+    return board, divmod(cells[0], cols), dirts[0] if dirt == 1 else dirts
+
+def _grid(board):
+    """(rows, cols, free) for a NumPy or list-of-lists board; free[i] is True unless flat cell i is an obstacle."""
+    b = np.asarray(board); return b.shape[0], b.shape[1], (b != OBSTACLE).ravel().tolist()
+
+# ── Step 2: BFS algorithm ──────────────────────────────────────
+def bfs_solve(board, start, goal, bidirectional=False, stats=None):
+    """Fewest-steps path as [(move, pos), ...] and its cost. stats (a dict) gets the node count.
+    goal may be a list of dirt cells, then plan_route visits all of them."""
+    if isinstance(goal, list): return plan_route(board, start, goal, stats)
+    if bidirectional: return bidirectional_bfs_solve(board, start, goal, stats)
+    rows, cols, free = _grid(board)
+    s, g    = start[0]*cols+start[1], goal[0]*cols+goal[1]
+    queue   = deque([s])                # flat cell indices
+    visited = {s: (None, None, 0)}      # cell -> (parent, move, cost)
+    expanded = 0
+    while queue:
+        i = queue.popleft(); expanded += 1
+        if i == g:                      # goal reached — rebuild path
+            if stats is not None: stats["expanded"] = expanded
+            path, cur = [], i
+            while visited[cur][1]:
+                parent, move, _ = visited[cur]
+                path.append((move, divmod(cur, cols))); cur = parent
+            return list(reversed(path)), visited[g][2]
+        r, c = divmod(i, cols)
+        for move, ((dr,dc), mc) in MOVES.items():
+            nr, nc = r+dr, c+dc
+            if 0<=nr<rows and 0<=nc<cols:
+                j = nr*cols+nc
+                if free[j] and j not in visited:
+                    visited[j] = (i, move, visited[i][2]+mc)
+                    queue.append(j)
+    if stats is not None: stats["expanded"] = expanded
+    return None, None                   # no solution
+
+# ── Step 2b: Bidirectional BFS (opt-in) ────────────────────────
+def bidirectional_bfs_solve(board, start, goal, stats=None):
+    """BFS from vacuum and dirt at once, one full layer of the smaller side per round.
+    Meets in the middle: ~2·b^(d/2) nodes instead of b^d. Same result format as bfs_solve."""
+    if start == goal: return [], 0
+    rows, cols, free = _grid(board)
+    fwd, bwd = {start: (None, None)}, {goal: (None, None)}   # pos -> (neighbour towards its root, move)
+    fl, bl, expanded, meet = [start], [goal], 0, None
+    while fl and bl and meet is None:
+        forward = len(fl) <= len(bl)
+        layer, seen, other = (fl, fwd, bwd) if forward else (bl, bwd, fwd)
+        nxt = []
+        for pos in layer:
+            expanded += 1; r, c = pos
+            for move, ((dr,dc), _) in MOVES.items():
+                npos = (r+dr, c+dc)
+                if (0<=npos[0]<rows and 0<=npos[1]<cols
+                        and free[npos[0]*cols+npos[1]] and npos not in seen):
+                    seen[npos] = (pos, move); nxt.append(npos)
+                    if meet is None and npos in other: meet = npos
+        if forward: fl = nxt
+        else:       bl = nxt
+    if stats is not None: stats["expanded"] = expanded
+    if meet is None: return None, None  # no solution
+    path, cur = [], meet                # start -> meet, moves as recorded
+    while fwd[cur][0] is not None:
+        parent, move = fwd[cur]; path.append((move, cur)); cur = parent
+    path.reverse(); cur = meet          # meet -> goal, each backward step walked the other way
+    while bwd[cur][0] is not None:
+        nxt_pos = bwd[cur][0]
+        move = next(m for m, ((dr,dc), _) in MOVES.items() if (cur[0]+dr, cur[1]+dc) == nxt_pos)
+        path.append((move, nxt_pos)); cur = nxt_pos
+    return path, sum(MOVES[m][1] for m,_ in path)
+
+# ── Step 2c: Uniform-cost search and A* (cheapest path) ────────
+def _rebuild(parents, goal):
+    path, cur = [], goal
+    while parents[cur][0] is not None:
+        parent, move = parents[cur]; path.append((move, cur)); cur = parent
+    return list(reversed(path))
+
+def cost_heuristic(pos, goal):
+    """Cheapest possible cost ignoring obstacles: every row up costs UP, every column LEFT/RIGHT,
+    rows down are free. Admissible and consistent, so A* stays optimal."""
+    dr, dc = goal[0]-pos[0], goal[1]-pos[1]
+    return (MOVES["UP"][1]*-dr if dr < 0 else MOVES["DOWN"][1]*dr) + \
+           (MOVES["LEFT"][1]*-dc if dc < 0 else MOVES["RIGHT"][1]*dc)
+
+def ucs_solve(board, start, goal, stats=None, heuristic=None):
+    """Dijkstra on the move costs (A* when a heuristic is given). Same result format as bfs_solve.
+    Zero-cost DOWN moves are fine: a position is only final when popped with its best cost,
+    stale heap entries are skipped, and a cheaper route always re-pushes the position."""
+    h = heuristic or (lambda pos, goal: 0)
+    rows, cols, free = _grid(board)
+    best    = {start: 0}
+    parents = {start: (None, None)}     # pos -> (parent, move)
+    heap, expanded = [(h(start, goal), 0, start)], 0
+    while heap:
+        _, g, pos = heapq.heappop(heap)
+        if g > best[pos]: continue      # stale entry
+        expanded += 1
+        if pos == goal:
+            if stats is not None: stats["expanded"] = expanded
+            return _rebuild(parents, goal), g
+        r, c = pos
+        for move, ((dr,dc), mc) in MOVES.items():
+            npos, ng = (r+dr, c+dc), g+mc
+            if (0<=npos[0]<rows and 0<=npos[1]<cols
+                    and free[npos[0]*cols+npos[1]]
+                    and ng < best.get(npos, ng+1)):
+                best[npos] = ng; parents[npos] = (pos, move)
+                heapq.heappush(heap, (ng + h(npos, goal), ng, npos))
+    if stats is not None: stats["expanded"] = expanded
+    return None, None                   # no solution
+
+def astar_solve(board, start, goal, stats=None):
+    return ucs_solve(board, start, goal, stats, heuristic=cost_heuristic)
+
+SOLVERS = {"BFS": bfs_solve, "UCS": ucs_solve, "A*": astar_solve}
+
+# ── Step 2d: Many dirt cells on large grids ────────────────────
+FIELD_CACHE_BYTES = 256 << 20           # keep distance fields for the route walk up to this size
+
+def distance_field(board, source, free=None):
+    """Step distance from source to every cell (-1 = unreachable) as a flat int32 array.
+    BFS over whole layers at once: the frontier is a NumPy array of flat indices and the
+    obstacle/visited checks are vectorized masks, so a 1000x1000 grid takes well under a second."""
+    b = np.asarray(board); rows, cols = b.shape; n = rows*cols
+    free = (b != OBSTACLE).ravel() if free is None else free
+    dist = np.full(n, -1, np.int32)
+    frontier = np.array([source[0]*cols+source[1]]); dist[frontier] = 0; d = 0
+    while frontier.size:
+        d += 1; c = frontier % cols
+        nxt = np.concatenate((frontier[frontier >= cols] - cols, frontier[frontier < n-cols] + cols,
+                              frontier[c > 0] - 1, frontier[c < cols-1] + 1))
+        nxt = np.unique(nxt[free[nxt] & (dist[nxt] < 0)])
+        dist[nxt] = d; frontier = nxt
+    return dist
+
+def _descend(field, start, rows, cols):
+    """Walk from start to the field's source, always to a neighbour one step closer."""
+    path, (r, c) = [], start
+    d = field[r*cols+c]
+    while d > 0:
+        for move, ((dr,dc), _) in MOVES.items():
+            nr, nc = r+dr, c+dc
+            if 0<=nr<rows and 0<=nc<cols and field[nr*cols+nc] == d-1:
+                r, c, d = nr, nc, d-1; path.append((move, (r, c))); break
+    return path
+
+def _nearest_order(dist, targets):
+    order, cur, left = [], 0, set(targets)
+    while left:
+        cur = min(left, key=lambda j: dist[cur][j]); order.append(cur); left.remove(cur)
+    return order
+
+def _two_opt(dist, order):
+    """Improve an open tour 0 -> order[0] -> ... by reversing segments while that shortens it."""
+    route, better = [0] + order, True
+    while better:
+        better = False
+        for i in range(1, len(route)-1):
+            for j in range(i+1, len(route)):
+                a, b, c = route[i-1], route[i], route[j]
+                after = route[j+1] if j+1 < len(route) else None
+                old = dist[a][b] + (dist[c][after] if after is not None else 0)
+                new = dist[a][c] + (dist[b][after] if after is not None else 0)
+                if new < old:
+                    route[i:j+1] = reversed(route[i:j+1]); better = True
+    return route[1:]
+
+def plan_route(board, start, dirts, stats=None):
+    """Visit every reachable dirt cell: one distance_field per point gives all pairwise step
+    distances, nearest-dirt greedy gives a first order and 2-opt (TSP-style) shortens it.
+    Returns (path, cost) like bfs_solve, path=None if no dirt is reachable.
+    stats gets expanded (cells labelled by all BFS runs), order and unreachable."""
+    b = np.asarray(board); rows, cols = b.shape
+    free = (b != OBSTACLE).ravel()
+    points = [tuple(start)] + [tuple(d) for d in dirts]
+    flat = np.array([r*cols+c for r,c in points])
+    keep = len(points)*rows*cols*4 <= FIELD_CACHE_BYTES
+    fields, dist, expanded = {}, np.empty((len(points), len(points)), np.int64), 0
+    for k, p in enumerate(points):
+        f = distance_field(b, p, free); expanded += int((f >= 0).sum())
+        dist[k] = f[flat]               # steps between point k and every point, -1 if unreachable
+        if keep: fields[k] = f
+    targets = [j for j in range(1, len(points)) if dist[0][j] >= 0]
+    order = _two_opt(dist.tolist(), _nearest_order(dist.tolist(), targets))
+    path, cur = [], points[0]
+    for j in order:                     # walk each leg down the target's distance field
+        f = fields[j] if keep else distance_field(b, points[j], free)
+        path += _descend(f, cur, rows, cols); cur = points[j]
+    if stats is not None:
+        stats.update(expanded=expanded, order=[points[j] for j in order],
+                     unreachable=len(points)-1-len(targets))
+    if not order: return None, None
+    return path, sum(MOVES[m][1] for m,_ in path)
+
+def benchmark(n=500, seed=0):
+    """Check bidirectional BFS, UCS and A* against bfs_solve on n seeded boards and print node counts."""
+    random.seed(seed); totals = {"bfs": 0, "bidirectional": 0, "ucs": 0, "astar": 0}; solved = 0
+    costs = {"bfs": 0, "ucs": 0}
+    for _ in range(n):
+        board, vp, dp = generate_board()
+        a, b = {}, {}
+        p1, _ = bfs_solve(board, vp, dp, stats=a)
+        p2, c2 = bfs_solve(board, vp, dp, bidirectional=True, stats=b)
+        assert (p1 is None) == (p2 is None), f"solvability differs on {board}"
+        if p1 is None: continue
+        assert len(p1) == len(p2) and p2[-1][1] == dp, f"path length differs on {board}"
+        cur = vp
+        for move, npos in p2:           # every step is a legal move
+            (dr,dc), _ = MOVES[move]
+            assert (cur[0]+dr, cur[1]+dc) == npos and board[npos[0]][npos[1]] != OBSTACLE
+            cur = npos
+        assert c2 == sum(MOVES[m][1] for m,_ in p2)
+        u, s = {}, {}
+        _, cu = ucs_solve(board, vp, dp, stats=u); _, cs = astar_solve(board, vp, dp, stats=s)
+        assert cu == cs <= bfs_solve(board, vp, dp)[1], f"UCS/A* cost not minimal on {board}"
+        solved += 1; totals["bfs"] += a["expanded"]; totals["bidirectional"] += b["expanded"]
+        totals["ucs"] += u["expanded"]; totals["astar"] += s["expanded"]
+        costs["bfs"] += bfs_solve(board, vp, dp)[1]; costs["ucs"] += cu
+    print(f"{n} boards ({solved} solvable), bidirectional as short as BFS, UCS = A* <= BFS cost")
+    for k,v in totals.items(): print(f"  {k:<14}: {v/max(solved,1):6.1f} nodes expanded avg")
+    for k,v in costs.items():  print(f"  {k:<14}: {v/max(solved,1):6.2f} path cost avg")
+
+# ── Step 3: Write solution.txt ─────────────────────────────────
+SYM = {EMPTY:".", OBSTACLE:"#", DIRT:"D", VACUUM:"V"}
+TILE = {v: k for k, v in SYM.items()}
+LETTER = {"UP":"U", "DOWN":"D", "LEFT":"L", "RIGHT":"R"}
+MOVE_OF = {v: k for k, v in LETTER.items()}
+VERBOSE_MAX_CELLS = 400                 # boards up to 20x20 get the full-board dump by default
+
+def write_file(board, start, goal, path, cost, algo="BFS", filename="solution.txt", fmt=None):
+    """fmt="verbose" dumps the whole board after every step, fmt="trace" writes the compact
+    trace (see write_trace). Default: verbose for small boards, trace for the rest."""
+    rows, cols = len(board), len(board[0])
+    if fmt is None: fmt = "verbose" if rows*cols <= VERBOSE_MAX_CELLS else "trace"
+    if fmt == "trace": return write_trace(board, start, goal, path, cost, algo, filename)
+    def draw(vp):
+        return "\n".join(" ".join("V" if (r,c)==vp else SYM[board[r][c]]
+                                  for c in range(cols)) for r in range(rows))
+    with open(filename,"w",encoding="utf-8") as f:
+        f.write(f"VACUUM WORLD — {algo}\nGrid:{rows}x{cols}  Vacuum:{start}  Dirt:{goal}\n")
+        f.write("Costs: UP=2 DOWN=0 LEFT=1 RIGHT=1\nLegend: V=Vacuum D=Dirt #=Obstacle .=Empty\n\n")
+        f.write("INITIAL BOARD:\n" + draw(start) + "\n\n")
+        if path is None:
+            f.write("NO SOLUTION — there is no solution because of obstacles.\n")
+            f.write("The dirt cannot be reached. Board at time of failure:\n\n")
+            f.write(draw(start) + "\n"); return
+        total = 0
+        for i,(move,npos) in enumerate(path,1):
+            total += MOVES[move][1]
+            f.write(f"Step {i}: {move} -> {npos}  (+{MOVES[move][1]}, total={total})\n")
+            f.write(draw(npos)+"\n\n")
+        f.write(f"GOAL REACHED!  Steps:{len(path)}  Total Cost:{cost}\n")
+
+# ── Step 3b: Compact trace ─────────────────────────────────────
+def rle_encode(board):
+    """Row-major run-length encoding of the grid, e.g. "12.1#3." (count then symbol)."""
+    flat = np.asarray(board).ravel()
+    edges = np.flatnonzero(np.diff(flat)) + 1
+    starts = np.concatenate(([0], edges)); ends = np.concatenate((edges, [flat.size]))
+    return "".join(f"{e-b}{SYM[int(flat[b])]}" for b, e in zip(starts, ends))
+
+def rle_decode(text, rows, cols):
+    runs = re.findall(r"(\d+)(\D)", text)
+    tiles = np.repeat(np.array([TILE[s] for _, s in runs], np.uint8), [int(n) for n, _ in runs])
+    return tiles.reshape(rows, cols)
+
+def write_trace(board, start, goal, path, cost, algo="BFS", filename="solution.txt"):
+    """Compact trace: the initial grid once (run-length encoded), then one letter per move and
+    one digit per move cost, so the file grows with steps + grid runs instead of steps × cells.
+    Any step can be rebuilt with read_trace / trace_positions (see trace_replay.py)."""
+    rows, cols = len(board), len(board[0])
+    dirts = goal if isinstance(goal, list) else [goal]
+    with open(filename,"w",encoding="utf-8") as f:
+        f.write(f"VACUUM-TRACE 1\nalgo {algo}\ngrid {rows} {cols}\nvacuum {start[0]} {start[1]}\n")
+        f.write("dirt " + ";".join(f"{r} {c}" for r,c in dirts) + "\n")
+        f.write("costs " + " ".join(f"{m}={mc}" for m, (_, mc) in MOVES.items()) + "\n")
+        f.write(f"cells {rle_encode(board)}\n")
+        if path is None:
+            f.write("result none\n"); return
+        f.write(f"result {len(path)} {cost}\n")
+        f.write("moves " + "".join(LETTER[m] for m,_ in path) + "\n")
+        f.write("deltas " + "".join(str(MOVES[m][1]) for m,_ in path) + "\n")
+
+def read_trace(filename):
+    """Parse a trace file into a dict: algo, board, start, dirt, moves (letters), deltas
+    (NumPy int array), cost and steps (None if there was no solution)."""
+    with open(filename, encoding="utf-8") as f:
+        if f.readline().strip() != "VACUUM-TRACE 1": raise ValueError(f"{filename} is not a vacuum trace")
+        fields = dict(line.rstrip("\n").partition(" ")[::2] for line in f)
+    rows, cols = map(int, fields["grid"].split())
+    result = fields["result"].split()
+    return {"algo": fields["algo"], "board": rle_decode(fields["cells"], rows, cols),
+            "start": tuple(map(int, fields["vacuum"].split())),
+            "dirt": [tuple(map(int, d.split())) for d in fields["dirt"].split(";")],
+            "moves": fields.get("moves", ""), "deltas": np.array([int(d) for d in fields.get("deltas", "")], np.int64),
+            "steps": int(result[0]) if result[0] != "none" else None,
+            "cost": int(result[1]) if result[0] != "none" else None}
+
+def trace_positions(trace):
+    """Vacuum position after every step as a (steps+1, 2) array, via a cumulative sum of the
+    move offsets, so trace_positions(t)[k] is step k in O(1) once built."""
+    offsets = np.array([MOVES[MOVE_OF[m]][0] for m in trace["moves"]], np.int64).reshape(-1, 2)
+    return np.vstack((trace["start"], trace["start"] + np.cumsum(offsets, axis=0)))
@@ -0,0 +1,21 @@
+"""
+Benchmark and regression harness for the week-2 solvers.
+
+Runs every solver on seeded, fixed corpora and reports nodes expanded, peak memory
+(tracemalloc), wall time and path cost per solver and corpus:
+
+    python -m benchmarks --output results.json                 # from week-2-project/
+    python -m benchmarks --baseline results.json               # fail on regressions
+
+The solver modules use flat imports (`from puzzle import ...`), so their folders are
+put on sys.path here instead of turning them into packages.
+"""
+
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _folder in ("rasyar", "TASK_E"):
+    _path = os.path.join(_ROOT, _folder)
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
@@ -0,0 +1,39 @@
+import argparse
+import json
+import sys
+
+from .corpora import SEED
+from .runner import compare, run
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the week-2 solvers")
+    parser.add_argument("--boards", type=int, default=10, metavar="N", help="Problems per corpus (default 10)")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--only", metavar="TEXT", help='Only run results whose key contains TEXT, e.g. "vacuum/"')
+    parser.add_argument("--output", metavar="FILE", help="Write the report as JSON")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare with a saved report and exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed increase of nodes, cost and memory (default 0.10)")
+    parser.add_argument("--time-threshold", type=float, default=0.50, help="Allowed increase of wall time (default 0.50)")
+    args = parser.parse_args()
+
+    report = run(args.boards, args.seed, args.only)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved {len(report['results'])} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold, args.time_threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
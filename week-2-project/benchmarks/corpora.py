@@ -0,0 +1,72 @@
+"""
+Seeded benchmark corpora. The same seed always gives the same boards, so results from
+different commits can be compared.
+
+- 8-puzzle boards grouped by their exact optimal depth, read from the distance table
+- vacuum grids grouped by size and obstacle density
+"""
+
+import os
+import random
+
+from distance_table import STATES, build_distance_table, index_to_state, load_distance_table
+
+SEED = 2024
+
+# Optimal solution length (moves) of the boards in each 8-puzzle corpus, inclusive
+PUZZLE_DEPTHS = {
+    "easy": (4, 10),
+    "medium": (11, 20),
+    "hard": (21, 31),
+}
+
+# Vacuum grid sizes and obstacle densities (share of cells that are obstacles)
+VACUUM_SIZES = [(6, 6), (50, 50)]
+VACUUM_DENSITIES = [0.1, 0.2, 0.3]
+
+DISTANCE_TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "rasyar", "distance_3x3.bin"
+)
+
+
+def _distance_table():
+    # Reuse the table the server builds; build it in memory if it is not there yet
+    if os.path.exists(DISTANCE_TABLE_PATH):
+        return load_distance_table(DISTANCE_TABLE_PATH)
+    return build_distance_table()
+
+
+def puzzle_corpora(count, seed=SEED):
+    """
+    Return {name: [(state, blank, depth), ...]} with `count` packed 8-puzzle boards per depth range, drawn without replacement from all reachable boards at those depths.
+    """
+
+    table = _distance_table()
+    rng = random.Random(seed)
+
+    corpora = {}
+    for name, (low, high) in PUZZLE_DEPTHS.items():
+        indices = [i for i in range(STATES) if low <= table[i] <= high]
+        boards = []
+        for index in sorted(rng.sample(indices, min(count, len(indices)))):
+            state, blank = index_to_state(index)
+            boards.append((state, blank, table[index]))
+        corpora[name] = boards
+    return corpora
+
+
+def vacuum_corpora(count, seed=SEED):
+    """
+    Return {name: [(board, vacuum, dirt), ...]} with `count` grids per size and obstacle density, named like "6x6-d0.2". Grids where the dirt cannot be reached are kept, solvers have to report them too.
+    """
+
+    from vacuum_core import generate_board
+
+    rng = random.Random(seed)
+    corpora = {}
+    for rows, cols in VACUUM_SIZES:
+        for density in VACUUM_DENSITIES:
+            corpora[f"{rows}x{cols}-d{density}"] = [
+                generate_board(rows, cols, 1, density, rng) for _ in range(count)
+            ]
+    return corpora
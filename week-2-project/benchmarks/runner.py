@@ -0,0 +1,189 @@
+"""
+Runs the solvers on the corpora and compares results with a saved baseline.
+
+Every result is keyed "suite/solver/corpus" and holds:
+    boards, solved, nodes_expanded (mean), path_cost (mean over solved boards),
+    wall_time_ms (mean), peak_memory_kb (max over boards)
+
+Wall time is measured in a separate pass without tracemalloc, since tracing every
+allocation slows the solvers down several times.
+"""
+
+import os
+import platform
+import time
+import tracemalloc
+
+from distance_table import table_solve
+from heuristics import HEURISTICS, init_pattern_db
+from search import ALGORITHMS
+
+from .corpora import DISTANCE_TABLE_PATH, _distance_table, puzzle_corpora, vacuum_corpora
+
+PATTERN_DB_PATH = os.path.join(os.path.dirname(DISTANCE_TABLE_PATH), "pdb_3x3.bin")
+
+# Node budget per 8-puzzle search, the whole reachable state space
+MAX_NODES = 181_440
+
+# Metrics that can regress; higher is worse for all of them
+METRICS = ("nodes_expanded", "path_cost", "wall_time_ms", "peak_memory_kb")
+
+# Timer noise on sub-millisecond solves, wall time differences below this never count
+TIME_SLACK_MS = 0.1
+
+
+def puzzle_solvers():
+    """
+    Return {name: solve(state, blank) -> (path, nodes_expanded)} for every 8-puzzle solver worth tracking.
+    """
+
+    init_pattern_db(PATTERN_DB_PATH)
+    table = _distance_table()
+
+    def search(algorithm, heuristic):
+        return lambda state, blank: ALGORITHMS[algorithm](state, blank, HEURISTICS[heuristic], MAX_NODES)
+
+    def lookup(state, blank):
+        path = table_solve(state, blank, table)
+        return path, len(path) - 1
+
+    return {
+        "greedy-manhattan": search("greedy", "manhattan"),
+        "astar-manhattan": search("astar", "manhattan"),
+        "astar-linear_conflict": search("astar", "linear_conflict"),
+        "astar-pattern_db": search("astar", "pattern_db"),
+        "idastar-linear_conflict": search("idastar", "linear_conflict"),
+        "bidirectional": search("bidirectional", "manhattan"),
+        "table": lookup,
+    }
+
+
+def vacuum_solvers():
+    """
+    Return {name: solve(board, vacuum, dirt) -> (cost or None, nodes_expanded)} for the vacuum world solvers.
+    """
+
+    from vacuum_core import astar_solve, bfs_solve, ucs_solve
+
+    def bfs(bidirectional):
+        def solve(board, vacuum, dirt):
+            stats = {}
+            _, cost = bfs_solve(board, vacuum, dirt, bidirectional=bidirectional, stats=stats)
+            return cost, stats["expanded"]
+
+        return solve
+
+    def weighted(solver):
+        def solve(board, vacuum, dirt):
+            stats = {}
+            _, cost = solver(board, vacuum, dirt, stats=stats)
+            return cost, stats["expanded"]
+
+        return solve
+
+    return {
+        "bfs": bfs(False),
+        "bfs-bidirectional": bfs(True),
+        "ucs": weighted(ucs_solve),
+        "astar": weighted(astar_solve),
+    }
+
+
+def measure(solve, problems):
+    """
+    Run solve(*problem) -> (cost or None, nodes_expanded) on every problem, once timed and once under tracemalloc, and return the aggregated metrics.
+    """
+
+    costs, nodes, seconds = [], 0, 0.0
+    for problem in problems:
+        start = time.perf_counter()
+        cost, expanded = solve(*problem)
+        seconds += time.perf_counter() - start
+        nodes += expanded
+        if cost is not None:
+            costs.append(cost)
+
+    peak = 0
+    for problem in problems:
+        tracemalloc.start()
+        solve(*problem)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    count = len(problems) or 1
+    return {
+        "boards": len(problems),
+        "solved": len(costs),
+        "nodes_expanded": round(nodes / count, 1),
+        "path_cost": round(sum(costs) / len(costs), 2) if costs else None,
+        "wall_time_ms": round(seconds * 1000 / count, 3),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def run(count, seed, only=None, log=print):
+    """
+    Benchmark every solver (or those whose key contains `only`) on `count` problems per corpus. Returns the report dict that is written as JSON.
+    """
+
+    results = {}
+
+    def record(key, solve, problems):
+        if only and only not in key:
+            return
+        results[key] = measure(solve, problems)
+        r = results[key]
+        log(
+            f"{key:<48} nodes {r['nodes_expanded']:>10} cost {r['path_cost']!s:>6} "
+            f"time {r['wall_time_ms']:>10.3f} ms  peak {r['peak_memory_kb']:>9} KB"
+        )
+
+    corpora = puzzle_corpora(count, seed)
+    for name, solve in puzzle_solvers().items():
+
+        def solve_board(state, blank, _depth, solve=solve):
+            path, expanded = solve(state, blank)
+            return (len(path) - 1 if path else None), expanded
+
+        for corpus, boards in corpora.items():
+            record(f"8puzzle/{name}/{corpus}", solve_board, boards)
+
+    corpora = vacuum_corpora(count, seed)
+    for name, solve in vacuum_solvers().items():
+        for corpus, grids in corpora.items():
+            record(f"vacuum/{name}/{corpus}", solve, grids)
+
+    return {
+        "seed": seed,
+        "boards_per_corpus": count,
+        "python": platform.python_version(),
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold, time_threshold):
+    """
+    Compare a report with a baseline report. A metric regresses when it is more than `threshold` (a fraction, e.g. 0.1 for 10%) above the baseline, or `time_threshold` for wall time, which is much noisier. Returns the list of regression messages; results only present on one side are skipped.
+    """
+
+    if (report["seed"], report["boards_per_corpus"]) != (baseline["seed"], baseline["boards_per_corpus"]):
+        return ["baseline was run on different corpora (seed or boards per corpus differ)"]
+
+    regressions = []
+    for key, result in report["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+        if result["solved"] < base["solved"]:
+            regressions.append(f"{key}: solved {result['solved']} boards, baseline {base['solved']}")
+        for metric in METRICS:
+            old, new = base.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            if metric == "wall_time_ms":
+                limit = old * (1 + time_threshold) + TIME_SLACK_MS
+            else:
+                limit = old * (1 + threshold)
+            if new > limit:
+                regressions.append(f"{key}: {metric} {new}, baseline {old}")
+    return regressions
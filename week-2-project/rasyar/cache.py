@@ -0,0 +1,113 @@
+"""
+Bounded LRU cache of puzzle solutions.
+
+Keys are (packed board, algorithm, heuristic) and values are (path, nodes_expanded)
+where path is the list of packed states from the board to the goal. Entries older
+than ttl seconds are dropped when they are read. If db_path is given, solutions are
+also written to a local sqlite file so they survive restarts; a miss in memory then
+falls back to the file before counting as a real miss.
+
+The sqlite connection is opened lazily in every process that uses the cache, so a
+cache created before a server forks its workers never shares a connection between them.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class SolutionCache:
+    def __init__(self, max_size=10_000, ttl=3600, db_path=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # key -> (path, nodes_expanded, created)
+        self.hits = 0
+        self.misses = 0
+
+        self._db = None
+        self._db_pid = None
+        if db_path:
+            with self.lock:
+                db = self._connection()
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS solutions ("
+                    "state TEXT, algorithm TEXT, heuristic TEXT, path TEXT, nodes INTEGER, created REAL, "
+                    "PRIMARY KEY (state, algorithm, heuristic))"
+                )
+                db.commit()
+
+    def get(self, key):
+        """
+        Return (path, nodes_expanded) for key, or None on a miss.
+        """
+
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None and self.db_path:
+                entry = self._load(key)
+                if entry is not None:
+                    self._store(key, entry)
+
+            if entry is None or now - entry[2] > self.ttl:
+                self.entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, key, path, nodes_expanded):
+        entry = (path, nodes_expanded, time.time())
+        with self.lock:
+            self._store(key, entry)
+            if self.db_path:
+                state, algorithm, heuristic = key
+                db = self._connection()
+                db.execute(
+                    "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?)",
+                    (str(state), algorithm, str(heuristic), ",".join(map(str, path)), nodes_expanded, entry[2]),
+                )
+                db.commit()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "disk": self.db_path,
+            }
+
+    def _connection(self):
+        # One connection per process shared by all its request threads, guarded by self.lock
+        if self._db_pid != os.getpid():
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db_pid = os.getpid()
+        return self._db
+
+    def _store(self, key, entry):
+        # Insert as most recently used and evict the least recently used if full
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def _load(self, key):
+        state, algorithm, heuristic = key
+        row = self._connection().execute(
+            "SELECT path, nodes, created FROM solutions WHERE state = ? AND algorithm = ? AND heuristic = ?",
+            (str(state), algorithm, str(heuristic)),
+        ).fetchone()
+        if row is None:
+            return None
+        return [int(s) for s in row[0].split(",")], row[1], row[2]
@@ -0,0 +1,184 @@
+"""
+Exact distance table for the whole 8-puzzle state space.
+
+Only 9!/2 = 181,440 boards are reachable from the goal, so a breadth-first search
+from the goal can store the optimal distance of every one of them in one byte.
+Boards are indexed by the empty cell and rank // 2 of the tile order (see ranking.py),
+giving a 181,440 byte table. Solving is then a greedy descent: from any board, step to the
+neighbour whose distance is one less, which always gives an optimal path.
+
+    python distance_table.py                    # builds distance_3x3.bin
+    python distance_table.py --benchmark 200    # compares against best-first search
+
+Like the pattern databases, the file is memory-mapped so workers share it.
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+from puzzle import BITS, CELLS, GOAL_BLANK, GOAL_STATE, MASK, decode_board, expand
+from ranking import permutation_parity, rank_permutation, unrank_permutation
+from table_file import atomic_write, map_table
+
+STATES = 181440  # 9! / 2
+UNSEEN = 255
+HALF = 20160  # 8! / 2, reachable orderings of the eight tiles for one blank position
+MAX_DEPTH = 31  # The hardest 8-puzzle boards need 31 moves
+
+# Ranges of optimal distances for the named difficulties of /generate
+DIFFICULTIES = {
+    "easy": (1, 10),
+    "medium": (11, 20),
+    "hard": (21, MAX_DEPTH),
+}
+
+
+def _tiles(state):
+    # The eight tiles in board order, skipping the empty cell
+    tiles = []
+    for i in range(CELLS):
+        tile = (state >> (BITS * i)) & MASK
+        if tile:
+            tiles.append(tile - 1)
+    return tiles
+
+
+def _blank(state):
+    for i in range(CELLS):
+        if not (state >> (BITS * i)) & MASK:
+            return i
+
+
+def state_index(state):
+    """
+    Position of a reachable board in the table: blank cell * 8!/2 + rank of the tile order // 2. On a 3x3 board a move never changes the parity of the tile order, so reachable boards are exactly those with an even tile order and halving the rank is a one-to-one mapping.
+    """
+
+    return _blank(state) * HALF + (rank_permutation(_tiles(state)) >> 1)
+
+
+def index_to_state(index):
+    """
+    Inverse of state_index: of the two tile orders with ranks 2*rank and 2*rank+1, keep the even one and put the empty tile back in its cell.
+    """
+
+    blank, rank = divmod(index, HALF)
+    for full_rank in (2 * rank, 2 * rank + 1):
+        tiles = unrank_permutation(full_rank, CELLS - 1)
+        if permutation_parity(tiles) == 0:
+            break
+
+    tiles.insert(blank, -1)
+    state = 0
+    for i, tile in enumerate(tiles):
+        state |= (tile + 1) << (BITS * i)
+    return state, blank
+
+
+def build_distance_table():
+    table = bytearray([UNSEEN]) * STATES
+    table[state_index(GOAL_STATE)] = 0
+    queue = deque([(GOAL_STATE, GOAL_BLANK, 0)])
+
+    while queue:
+        state, blank, distance = queue.popleft()
+        for next_state, next_blank, _ in expand(state, blank):
+            index = state_index(next_state)
+            if table[index] == UNSEEN:
+                table[index] = distance + 1
+                queue.append((next_state, next_blank, distance + 1))
+
+    return table
+
+
+def write_distance_table(path):
+    atomic_write(path, [build_distance_table()])
+
+
+def load_distance_table(path):
+    return map_table(path, lambda mapping: len(mapping) == STATES, "an 8-puzzle distance table")
+
+
+def table_solve(state, blank, table):
+    """
+    Walk down the distance table from state to the goal. Returns the list of packed states (start to goal), or None if the board is not reachable from the goal.
+    """
+
+    if permutation_parity(_tiles(state)):
+        return None  # Odd tile orders are not reachable and not in the table
+
+    path = [state]
+    distance = table[state_index(state)]
+    while distance:
+        for next_state, next_blank, _ in expand(state, blank):
+            if table[state_index(next_state)] == distance - 1:
+                state, blank = next_state, next_blank
+                break
+        path.append(state)
+        distance -= 1
+
+    return path
+
+
+def indices_by_depth(table):
+    # indices[d] = table indices of every board whose optimal distance is exactly d
+    indices = [[] for _ in range(MAX_DEPTH + 1)]
+    for index in range(len(table)):
+        indices[table[index]].append(index)  # Indexing an mmap gives ints, iterating it gives bytes
+    return indices
+
+
+def random_state_at_depth(indices, low, high=None, rng=random):
+    """
+    Uniformly random board among all boards whose optimal distance is between low and high (inclusive, high defaults to low), as (state, blank). indices comes from indices_by_depth.
+    """
+
+    high = low if high is None else high
+    pick = rng.randrange(sum(len(indices[d]) for d in range(low, high + 1)))
+    for depth in range(low, high + 1):
+        if pick < len(indices[depth]):
+            return index_to_state(indices[depth][pick])
+        pick -= len(indices[depth])
+
+
+def benchmark(table, count):
+    # Lazy imports, only needed when comparing against the search
+    from heuristics import manhattan
+    from search import greedy_search
+
+    boards = [index_to_state(random.randrange(STATES)) for _ in range(count)]
+
+    start = time.perf_counter()
+    table_moves = sum(len(table_solve(s, b, table)) - 1 for s, b in boards)
+    table_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    search_moves = 0
+    for s, b in boards:
+        path, _ = greedy_search(s, b, manhattan, STATES)
+        search_moves += len(path) - 1
+    search_time = time.perf_counter() - start
+
+    print(f"{count} random boards, e.g. {decode_board(boards[0][0])}")
+    print(f"  table descent     : {table_time * 1e6 / count:10.1f} us/board, {table_moves / count:.1f} moves avg")
+    print(f"  best-first search : {search_time * 1e6 / count:10.1f} us/board, {search_moves / count:.1f} moves avg")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the 8-puzzle distance table")
+    parser.add_argument("--output", default="distance_3x3.bin")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="Compare against best-first search on N random boards")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    write_distance_table(args.output)
+    print(f"Saved {STATES} distances to {args.output} in {time.perf_counter() - start:.1f}s")
+
+    if args.benchmark:
+        benchmark(load_distance_table(args.output), args.benchmark)
+
+
+if __name__ == "__main__":
+    main()
@@ -43,6 +43,7 @@ function App() {
       setIsSolving(true);
       const response = await axios.post<SolutionResponse>(`${API_URL}/solve`, {
         board,
+        save_file: true,
       });
       setSolution(response.data);
       setIsSolving(false);
@@ -191,7 +192,7 @@ function App() {
 
       <footer>
         <p>
-          Solution saved to <code>solution.txt</code>
+          Solutions saved to <code>solutions/</code>
         </p>
       </footer>
     </div>
@@ -0,0 +1,39 @@
+"""
+Gunicorn settings for the puzzle backend: gunicorn -c gunicorn.conf.py wsgi:app
+
+Every setting can be overridden with an environment variable:
+    PORT                 port to listen on (3500)
+    PUZZLE_WORKERS       worker processes (one per core)
+    PUZZLE_THREADS       threads per worker (4)
+    PUZZLE_BATCH_WORKERS /solve/batch processes per worker (cores / workers)
+    PUZZLE_MAX_SECONDS   search time budget per request (30)
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 3500)}"
+workers = int(os.environ.get("PUZZLE_WORKERS", os.cpu_count() or 1))
+
+# Threads keep /health and streamed responses answering while a worker is busy searching
+worker_class = "gthread"
+threads = int(os.environ.get("PUZZLE_THREADS", 4))
+
+# Every worker lazily starts its own /solve/batch process pool. Split the cores between
+# them, otherwise workers * cores solver processes would compete for the same cores.
+# Set here, before preload_app imports index.py, so the master and all workers see it.
+os.environ.setdefault("PUZZLE_BATCH_WORKERS", str(max(1, (os.cpu_count() or 1) // workers)))
+
+# Load index.py (and all its tables) once in the master, then fork: workers share the
+# tables copy-on-write instead of every worker building its own copy
+preload_app = True
+
+# Searches stop themselves after PUZZLE_MAX_SECONDS (503 to the client), a batch shares one
+# such budget. Nothing here kills a long search: with gthread workers the heartbeat comes
+# from the worker's main loop, not the request threads, so `timeout` only restarts a worker
+# whose main loop itself hangs. It is set a bit higher than the search budget.
+max_seconds = int(os.environ.get("PUZZLE_MAX_SECONDS", 30))
+timeout = max_seconds + 15
+graceful_timeout = max_seconds + 5
+keepalive = 5
+
+accesslog = "-"
@@ -0,0 +1,143 @@
+"""
+Heuristics for sliding puzzles, all working on packed states (see puzzle.py).
+
+Every heuristic is a function state -> estimated number of moves to the goal.
+They are all admissible, so A* and IDA* return optimal paths with any of them:
+
+- manhattan: sum of tile distances from their goal cells
+- linear_conflict: Manhattan plus 2 moves for every tile that has to leave its goal row/column
+  to let another tile in the same line pass
+- pattern_db: disjoint additive pattern databases (exact costs for groups of tiles),
+  memory-mapped from the file built by pattern_db.py
+
+HEURISTICS holds the 3x3 versions. get_heuristics(size) returns the same set for
+bigger boards; pattern_db is only included once its tables have been loaded with
+init_pattern_db (the 4x4 file has to be built offline first).
+"""
+
+import os
+
+from pattern_db import (
+    DEFAULT_GROUPS,
+    PatternDatabase,
+    build_pattern_table,
+    load_pattern_db,
+    write_pattern_db,
+)
+from puzzle import BITS, CELLS, GOAL_BOARD, MASK, SIZE, get_puzzle, manhattan
+
+GOAL_INDEX = [0] * CELLS  # GOAL_INDEX[tile] = cell index of the tile in the goal board
+for _i, _tile in enumerate(t for row in GOAL_BOARD for t in row):
+    GOAL_INDEX[_tile] = _i
+GOAL_ROW = [index // SIZE for index in GOAL_INDEX]
+GOAL_COL = [index % SIZE for index in GOAL_INDEX]
+
+# Disjoint tile groups used for the additive pattern database
+PATTERN_GROUPS = DEFAULT_GROUPS[SIZE]
+
+
+def _line_conflicts(goal_lines):
+    """
+    Number of tiles that must be moved out of a line so that the remaining tiles are in goal order. goal_lines holds, in board order, the goal position along the line of every tile that belongs to this line, so the tiles that can stay form its longest increasing subsequence.
+    """
+
+    longest = [1] * len(goal_lines)
+    for i in range(len(goal_lines)):
+        for j in range(i):
+            if goal_lines[j] < goal_lines[i] and longest[j] + 1 > longest[i]:
+                longest[i] = longest[j] + 1
+    return len(goal_lines) - max(longest)
+
+
+def _conflict_moves(tiles, size, goal_row, goal_col):
+    # Extra moves on top of Manhattan: 2 for every tile that has to step out of its row or column
+    extra = 0
+    for line in range(size):
+        row = [goal_col[t] for t in tiles[line * size : (line + 1) * size] if t and goal_row[t] == line]
+        col = [goal_row[t] for t in tiles[line::size] if t and goal_col[t] == line]
+        if len(row) > 1:
+            extra += _line_conflicts(row)
+        if len(col) > 1:
+            extra += _line_conflicts(col)
+    return 2 * extra
+
+
+def linear_conflict(state):
+    tiles = [(state >> (BITS * i)) & MASK for i in range(CELLS)]
+    return manhattan(state) + _conflict_moves(tiles, SIZE, GOAL_ROW, GOAL_COL)
+
+
+_pattern_databases = {}  # Board size -> loaded PatternDatabase
+
+
+def init_pattern_db(path, size=SIZE):
+    """
+    Memory-map the pattern database file at path. The 3x3 file is built first if it does not exist yet (it only takes a moment); bigger boards must be built offline with pattern_db.py and are skipped if the file is missing. Called once at startup so every lookup afterwards is plain array indexing.
+    """
+
+    if not os.path.exists(path):
+        if size != SIZE:
+            return
+        print(f"[Heuristics] Building pattern database {path}...")
+        write_pattern_db(path, SIZE, PATTERN_GROUPS)
+    _pattern_databases[size] = load_pattern_db(path)
+    _heuristics.pop(size, None)
+
+
+def pattern_db(state):
+    database = _pattern_databases.get(SIZE)
+    if database is None:
+        # Not initialised from a file, fall back to tables built in memory
+        tables = [build_pattern_table(group, SIZE) for group in PATTERN_GROUPS]
+        database = _pattern_databases[SIZE] = PatternDatabase(SIZE, PATTERN_GROUPS, tables)
+
+    where = [0] * CELLS
+    for i in range(CELLS):
+        where[(state >> (BITS * i)) & MASK] = i
+
+    return database.estimate(where)
+
+
+HEURISTICS = {
+    "manhattan": manhattan,
+    "linear_conflict": linear_conflict,
+    "pattern_db": pattern_db,
+}
+
+
+def make_heuristics(puzzle):
+    # Build the heuristics for an N x N SlidingPuzzle, reusing its packed layout and tables
+    size, cells, bits, mask = puzzle.size, puzzle.cells, puzzle.bits, puzzle.mask
+    goal_row = [((t - 1) % cells) // size for t in range(cells)]
+    goal_col = [((t - 1) % cells) % size for t in range(cells)]
+
+    def linear_conflict(state):
+        tiles = [(state >> (bits * i)) & mask for i in range(cells)]
+        return puzzle.manhattan(state) + _conflict_moves(tiles, size, goal_row, goal_col)
+
+    heuristics = {"manhattan": puzzle.manhattan, "linear_conflict": linear_conflict}
+
+    database = _pattern_databases.get(size)
+    if database is not None:
+
+        def pattern_db(state):
+            where = [0] * cells
+            for i in range(cells):
+                where[(state >> (bits * i)) & mask] = i
+            return database.estimate(where)
+
+        heuristics["pattern_db"] = pattern_db
+
+    return heuristics
+
+
+_heuristics = {}
+
+
+def get_heuristics(size):
+    # Heuristics available for a board size, the 3x3 ones are the module-level functions
+    if size == SIZE:
+        return HEURISTICS
+    if size not in _heuristics:
+        _heuristics[size] = make_heuristics(get_puzzle(size))
+    return _heuristics[size]
@@ -1,168 +1,397 @@
 from flask import Flask  # For creating the web app
 from flask_cors import CORS  # For handling cross-origin requests
-import random  # For generating random numbers
-import heapq  # Priority queue implementation
+import os  # For locating the pattern database and distance table files
+import time  # For timing each board of a batch
+import queue  # Hands solution reports to the background writer
+import threading  # Background writer thread for solution reports
+import uuid  # Unique solution report file names
+from concurrent.futures import ProcessPoolExecutor  # Worker processes for /solve/batch
 from datetime import datetime  # For measuring execution time
 from flask import jsonify  # For returning JSON responses
 from flask import request  # For handling incoming requests
+from flask import Response  # For streaming responses
+import json  # For encoding streamed events
+from puzzle import (  # Packed board representation used by the search
+    SIZE,
+    SUPPORTED_SIZES,
+    board_error,
+    encode_board,
+    get_puzzle,
+    manhattan,
+)
+from search import ALGORITHMS, SearchLimitExceeded  # Greedy, A* and IDA* solvers
+from cache import SolutionCache  # LRU cache of solved boards
+from distance_table import (  # Exact distances for all 181,440 boards
+    DIFFICULTIES,
+    MAX_DEPTH,
+    indices_by_depth,
+    load_distance_table,
+    random_state_at_depth,
+    state_index,
+    table_solve,
+    write_distance_table,
+)
+from heuristics import (  # Manhattan, linear conflict and pattern database
+    HEURISTICS,
+    get_heuristics,
+    init_pattern_db,
+)
 
 app = Flask(__name__)
 CORS(app)  # Allow the react frontend to make requests to this backend
 
+# Upper bounds per search, so one hard board cannot exhaust the worker. The 8-puzzle only
+# has 181,440 reachable states, so these only ever cut off 4x4 and 5x5 searches.
+MAX_NODES = 1_000_000
+MAX_SECONDS = int(os.environ.get("PUZZLE_MAX_SECONDS", 30))  # Also the per-request timeout under gunicorn
+
+# Pattern database tables, built by pattern_db.py and memory-mapped once at startup so
+# every worker process reads the same copy from the page cache. The 4x4 tables are only
+# used if pdb_4x4.bin has been built offline.
+PATTERN_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb_3x3.bin")
+PATTERN_DB_4X4_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb_4x4.bin")
+init_pattern_db(PATTERN_DB_PATH)
+init_pattern_db(PATTERN_DB_4X4_PATH, size=4)
+for _size in SUPPORTED_SIZES:
+    get_heuristics(_size)  # Build every size's tables now, so forked workers share them copy-on-write
+
+# Optimal distance of every reachable board (built by distance_table.py), used by /solve?mode=table
+DISTANCE_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "distance_3x3.bin")
+if not os.path.exists(DISTANCE_TABLE_PATH):
+    print(f"[Backend] Building distance table {DISTANCE_TABLE_PATH}...")
+    write_distance_table(DISTANCE_TABLE_PATH)
+DISTANCE_TABLE = load_distance_table(DISTANCE_TABLE_PATH)
+DEPTH_INDICES = indices_by_depth(DISTANCE_TABLE)  # Boards grouped by optimal distance, for /generate?depth=
+
+# Most boards one /generate?count= call returns, the longest /generate?moves= scramble, and
+# the most random moves one request may make in total (count * moves, about 2 s of CPU)
+MAX_GENERATE_COUNT = 10_000
+MAX_SCRAMBLE_MOVES = 10_000
+MAX_SCRAMBLE_TOTAL = 1_000_000
+
+# Recently solved boards; set PUZZLE_CACHE_DB to a file path to keep them across restarts
+CACHE_SIZE = 10_000
+CACHE_TTL = 3600  # Seconds
+SOLUTION_CACHE = SolutionCache(CACHE_SIZE, CACHE_TTL, os.environ.get("PUZZLE_CACHE_DB"))
+
+# Boards met half-way along a cached optimal path, in memory only and in their own LRU so
+# they can never push the submitted boards out of SOLUTION_CACHE. An entry is a reference
+# (full path, offset) into the solved path, so a solve of length L costs O(L), not O(L^2).
+SUFFIX_CACHE_SIZE = 10_000
+SUFFIX_CACHE = SolutionCache(SUFFIX_CACHE_SIZE, CACHE_TTL)
+
+# /solve/batch fans boards out over a pool of processes, one per core by default. Every
+# server process gets its own pool, so gunicorn.conf.py sets PUZZLE_BATCH_WORKERS to its
+# share of the cores instead
+BATCH_WORKERS = max(1, int(os.environ.get("PUZZLE_BATCH_WORKERS", os.cpu_count() or 1)))
+MAX_BATCH_SIZE = 1000
+_batch_executor = None
+
+# Solution reports are opt-in: send "save_file": true with /solve, or set
+# PUZZLE_SAVE_SOLUTIONS=1 to write one for every request
+SAVE_SOLUTIONS = os.environ.get("PUZZLE_SAVE_SOLUTIONS") == "1"
+SOLUTIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solutions")
+SOLUTION_QUEUE = queue.Queue()
+_writer_thread = None
+
+
+def generate_random_puzzle(size=SIZE, depth=None, moves=None):
+    """
+    Random solvable board. By default every solvable board is equally likely. depth=(low, high) picks uniformly among the 3x3 boards whose optimal solution is between low and high moves, using the distance table; moves=N scrambles the goal with N random moves instead.
+    """
 
-def generate_random_puzzle():
-    board = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
-
-    # Shuffle the goal state to create a random puzzle
-    for _ in range(100):
-        moves = get_possible_moves(board)
-        if moves:
-            board = random.choice(moves)
+    puzzle = get_puzzle(size)
+    if depth is not None:
+        state, _ = random_state_at_depth(DEPTH_INDICES, *depth)
+    elif moves is not None:
+        state, _ = puzzle.random_walk(moves)
+    else:
+        state, _ = puzzle.random_state()
+    return puzzle.decode_board(state)
 
-    return board
 
+def manhattan_distance(board):
+    """
+    This method calculates the Manhattan distance heuristic for the 8-puzzle problem. The Manhattan distance is the sum of the absolute differences of the row and column indices of each tile from its goal position. The distances are read from the table precomputed in puzzle.py, so nothing is rebuilt per call. The empty tile (0) is not included in the calculation.
+    """
 
-def get_possible_moves(board):
+    state, _ = encode_board(board)
+    return manhattan(state)
+
+
+# Algorithms that always return a shortest path
+OPTIMAL_ALGORITHMS = {"astar", "idastar", "bidirectional", "table"}
+
+# Titles used in solution.txt for each algorithm
+ALGORITHM_NAMES = {
+    "greedy": "BEST-FIRST SEARCH",
+    "astar": "A* SEARCH",
+    "idastar": "IDA* SEARCH",
+    "bidirectional": "BIDIRECTIONAL BFS",
+    "table": "DISTANCE TABLE",
+}
+
+
+def solve_packed(
+    start_state,
+    start_blank,
+    algorithm,
+    heuristic,
+    max_nodes=MAX_NODES,
+    progress=None,
+    max_seconds=None,
+    size=SIZE,
+):
     """
-    This methods takes the current board state and returns a list of new board states that can be reached by moving the empty tile (0) in one of the four possible directions (up, down, left, right). Each new board state is a result of swapping the empty tile with an adjacent tile in the specified direction. The method ensures that the new positions are within the bounds of the 3x3 grid.
+    Run the chosen solver on a packed board and return (path of packed states or None, nodes_expanded). 3x3 boards take the fast path of search.py; bigger boards pass their SlidingPuzzle along.
     """
 
-    moves = []
+    if algorithm == "table":
+        path = table_solve(start_state, start_blank, DISTANCE_TABLE)
+        return path, len(path) - 1 if path else 0
+    return ALGORITHMS[algorithm](
+        start_state,
+        start_blank,
+        get_heuristics(size)[heuristic],
+        max_nodes,
+        progress,
+        max_seconds,
+        None if size == SIZE else get_puzzle(size),
+    )
+
+
+def solve_board(board, algorithm="greedy", heuristic="manhattan", max_nodes=MAX_NODES, max_seconds=None):
+    """
+    Solve a list-of-lists board (3x3, 4x4 or 5x5) with one of the algorithms from search.py and one of the heuristics from heuristics.py, or with algorithm="table" by walking down the precomputed 3x3 distance table (no search, the heuristic is ignored). The board is packed once here and the path is unpacked once at the end, so the search itself never touches lists. Returns (steps, nodes_expanded) where steps is None if there is no solution.
+    """
 
-    # fine where the empty tile is
-    zero_pos = find_zero(board)
-    row, col = (
-        zero_pos  # Position of the empty tile (e.g. (2, 2) for the initial state)
+    puzzle = get_puzzle(len(board))
+    start_state, start_blank = puzzle.encode_board(board)
+    path, expanded = solve_packed(
+        start_state, start_blank, algorithm, heuristic, max_nodes, None, max_seconds, puzzle.size
     )
 
-    # The four possible directions to move the empty tile: up, down, left, right
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-    # Generate new board states by moving the empty tile in each direction
-    for dr, dc in directions:
-        new_row = row + dr
-        new_col = col + dc
-
-        # if the new position is within the bounds of the board, create a new board state by swapping the empty tile with the adjacent tile in that direction and add it to the list of possible moves
-        if 0 <= new_row < 3 and 0 <= new_col < 3:
-            new_board = [
-                row[:] for row in board
-            ]  # Deep copy of the board with new memory ref
-            temp = new_board[row][col]
-            new_board[row][col] = new_board[new_row][new_col]
-            new_board[new_row][new_col] = temp
-            moves.append(new_board)
-
-    return moves
-
-
-def find_zero(board):
-    # Find the position of the empty tile
-    for i in range(3):
-        for j in range(3):
-            if board[i][j] == 0:
-                return (i, j)
-    return None
+    if path is None:
+        return None, expanded
+    return [puzzle.decode_board(state) for state in path], expanded
 
 
-def board_to_tuple(board):
-    # Convert the board to a tuple of tuples for immutability and hashing
-    return tuple(tuple(row) for row in board)
+def cache_key(size, state, algorithm, heuristic):
+    # Packed states of different sizes can share the same integer, so tag the bigger boards
+    return (state if size == SIZE else f"{size}x{size}:{state}", algorithm, heuristic)
 
 
-def manhattan_distance(board):
+def cached_solve(board, algorithm="greedy", heuristic="manhattan", max_nodes=MAX_NODES, max_seconds=None):
     """
-    This method calculates the Manhattan distance heuristic for the 8-puzzle problem. The Manhattan distance is the sum of the absolute differences of the row and column indices of each tile from its goal position. The method iterates through each tile in the current board state, calculates its current position and its goal position, and accumulates the total distance. The empty tile (0) is not included in the calculation.
+    Same as solve_board but looks the answer up in SOLUTION_CACHE first and stores new solutions in it. For optimal algorithms every state on the returned path also gets its remaining suffix cached in SUFFIX_CACHE, since the rest of an optimal path is an optimal path too. Returns (steps, nodes_expanded, cached).
     """
 
-    distance = 0
-    goal_positions = {
-        1: (0, 0),
-        2: (0, 1),
-        3: (0, 2),
-        4: (1, 0),
-        5: (1, 1),
-        6: (1, 2),
-        7: (2, 0),
-        8: (2, 1),
-        0: (2, 2),
-    }
+    puzzle = get_puzzle(len(board))
+    start_state, start_blank = puzzle.encode_board(board)
+    key = cache_key(puzzle.size, start_state, algorithm, heuristic)
+
+    hit = SOLUTION_CACHE.get(key)
+    if hit is not None:
+        path, expanded = hit
+        return [puzzle.decode_board(state) for state in path], expanded, True
 
-    for i in range(3):
-        for j in range(3):
-            tile = board[i][j]
+    hit = SUFFIX_CACHE.get(key)
+    if hit is not None:
+        (path, offset), _ = hit
+        return [puzzle.decode_board(state) for state in path[offset:]], 0, True
 
-            if tile != 0:
-                goal_i, goal_j = goal_positions[tile]
-                distance += abs(i - goal_i) + abs(j - goal_j)
+    path, expanded = solve_packed(
+        start_state, start_blank, algorithm, heuristic, max_nodes, None, max_seconds, puzzle.size
+    )
+    if path is None:
+        return None, expanded, False
+
+    SOLUTION_CACHE.put(key, path, expanded)
+    if algorithm in OPTIMAL_ALGORITHMS:
+        for i in range(1, len(path) - 1):
+            suffix_key = cache_key(puzzle.size, path[i], algorithm, heuristic)
+            SUFFIX_CACHE.put(suffix_key, (path, i), 0)
 
-    return distance
+    return [puzzle.decode_board(state) for state in path], expanded, False
 
 
-def best_first_search(start_board):
+def best_first_search(start_board, max_nodes=MAX_NODES):
     """
     This method implements the Best-First Search algorithm to solve the 8-puzzle problem. It uses a priority queue (min-heap) to explore the board states based on their Manhattan distance heuristic. The algorithm starts with the initial board state and repeatedly explores the most promising board state (the one with the lowest Manhattan distance) until it reaches the goal state. It also keeps track of visited states to avoid cycles and ensures that it does not revisit previously explored board configurations.
+
+    This is the greedy solver from search.py with the Manhattan heuristic. If more than max_nodes states are expanded, SearchLimitExceeded is raised.
     """
 
-    goal = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+    steps, _ = solve_board(start_board, "greedy", "manhattan", max_nodes)
+    return steps
 
-    frontier = []
-    heapq.heappush(
-        frontier, (manhattan_distance(start_board), start_board, [start_board])
-    )
 
-    # Track visited states to avoid cycles
-    visited = set()
-    visited.add(board_to_tuple(start_board))
+def solution_writer():
+    # Background thread: writes queued solution reports so /solve never waits on the disk
+    while True:
+        initial_board, solution_steps, algorithm, path = SOLUTION_QUEUE.get()
+        try:
+            save_solution_file(initial_board, solution_steps, algorithm, path)
+        except Exception as e:
+            print(f"[Backend] Could not write {path}: {str(e)}")
+        finally:
+            SOLUTION_QUEUE.task_done()
+
+
+def queue_solution_file(initial_board, solution_steps, algorithm):
+    """
+    Queue a solution report for the background writer and return the file it will be written to. Every request gets its own file in SOLUTIONS_DIR, so concurrent requests never overwrite each other.
+    """
+
+    global _writer_thread
+    if _writer_thread is None:
+        os.makedirs(SOLUTIONS_DIR, exist_ok=True)
+        _writer_thread = threading.Thread(target=solution_writer, daemon=True)
+        _writer_thread.start()
+
+    name = f"solution_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.txt"
+    path = os.path.join(SOLUTIONS_DIR, name)
+    SOLUTION_QUEUE.put((initial_board, solution_steps, algorithm, path))
+    return path
+
+
+def read_json_body():
+    # The JSON body as a dict, or None if it is missing, malformed or not a JSON object
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else None
+
+
+def read_solve_options(data):
+    """
+    Read the solver options shared by /solve, /solve/batch and /solve/stream from the JSON body and the query string. Returns (options, error) where options is a dict with algorithm, heuristic, max_nodes and max_seconds, and error is a message if an option is invalid.
+    """
+
+    # Optional per-request budgets, never above the server limits
+    max_nodes = data.get("max_nodes", MAX_NODES)
+    if type(max_nodes) is not int or max_nodes <= 0:
+        return None, "max_nodes must be a positive integer"
+    max_seconds = data.get("max_seconds", MAX_SECONDS)
+    if type(max_seconds) not in (int, float) or max_seconds <= 0:
+        return None, "max_seconds must be a positive number"
+
+    # Which solver and heuristic to use, greedy best-first on Manhattan by default
+    algorithm = data.get("algorithm", "greedy")
+    heuristic = data.get("heuristic", "manhattan")
+    if not isinstance(algorithm, str) or algorithm not in ALGORITHMS:
+        return None, f"algorithm must be one of {list(ALGORITHMS)}"
+    if not isinstance(heuristic, str) or heuristic not in HEURISTICS:
+        return None, f"heuristic must be one of {list(HEURISTICS)}"
+
+    # ?mode=table skips the search and reads the answer from the distance table
+    mode = request.args.get("mode", "search")
+    if mode not in ("search", "table"):
+        return None, "mode must be 'search' or 'table'"
+    if mode == "table":
+        algorithm, heuristic = "table", None
+
+    options = {
+        "algorithm": algorithm,
+        "heuristic": heuristic,
+        "max_nodes": min(max_nodes, MAX_NODES),
+        "max_seconds": min(max_seconds, MAX_SECONDS),
+    }
+    return options, None
+
+
+def board_problem(board, options):
+    """
+    Everything that makes a board impossible to solve with the given options, checked before any search runs: malformed boards, unsolvable boards, and options that do not exist for the board size. Returns a message, or None if the board can be solved.
+    """
+
+    error = board_error(board)
+    if error:
+        return error
+
+    puzzle = get_puzzle(len(board))
+    if not puzzle.is_solvable(puzzle.encode_board(board)[0]):
+        return "Board is not solvable"  # Half of all boards can never reach the goal
+
+    if options["algorithm"] == "table" and puzzle.size != SIZE:
+        return "The distance table only covers 3x3 boards"
+    if options["heuristic"] and options["heuristic"] not in get_heuristics(puzzle.size):
+        return f"{options['heuristic']} is not available for {puzzle.size}x{puzzle.size} boards"
+
+    return None
+
+
+def solve_task(task):
+    """
+    Solve one board of a batch. Runs inside a worker process of the batch pool, so it only uses plain data in and out. The whole batch shares one deadline (a time.time() value, the clock every process agrees on): each search only gets the time left, and boards reached after it are not searched at all. Returns the result dict for that board, including how long it took.
+    """
+
+    board, options, deadline = task
+    start = time.perf_counter()
 
-    while frontier:
-        _, current_board, path = heapq.heappop(frontier)
+    error = board_problem(board, options)
+    if error:
+        return {"error": error}
 
-        # Check if we reached goal state
-        if current_board == goal:
-            return path
+    budget = options["max_seconds"]
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        return {"error": f"Batch aborted after {budget} seconds"}
 
-        # Expolore neighbors
-        for next_board in get_possible_moves(current_board):
-            board_tuple = board_to_tuple(next_board)
+    try:
+        steps, expanded = solve_board(board, **dict(options, max_seconds=min(budget, remaining)))
+    except SearchLimitExceeded as e:
+        if e.max_seconds is not None:
+            return {"error": f"Batch aborted after {budget} seconds"}  # The time left was all it had
+        return {"error": str(e)}
+
+    return {
+        "steps": steps,
+        "total_cost": len(steps) - 1,
+        "nodes_expanded": expanded,
+        "time_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
 
-            if board_tuple not in visited:
-                visited.add(board_tuple)
-                new_path = path + [next_board]
-                priority = manhattan_distance(next_board)
-                heapq.heappush(frontier, (priority, next_board, new_path))
 
-    return None  # No solution which is rarely the case
+def get_batch_executor():
+    # Process pool for /solve/batch, created on first use with BATCH_WORKERS processes
+    global _batch_executor
+    if _batch_executor is None:
+        _batch_executor = ProcessPoolExecutor(max_workers=BATCH_WORKERS)
+    return _batch_executor
 
 
-def save_solution_file(initial_board, solution_steps):
+def save_solution_file(initial_board, solution_steps, algorithm="greedy", path="solution.txt"):
     """
-    Save solution to solution.txt in a nice format.
+    Save solution to solution.txt (or the given path) in a nice format.
     """
-    with open("solution.txt", "w", encoding="utf-8") as f:
+    size = len(initial_board)
+    width = len(str(size * size - 1))  # Two-digit tiles on 4x4 and 5x5 boards
+    line = "-" * ((width + 3) * size + 1)
+
+    def board_rows(board):
+        for row in board:
+            tiles = (str(x).rjust(width) if x != 0 else " " * width for x in row)
+            yield "| " + " | ".join(tiles) + " |\n"
+
+    with open(path, "w", encoding="utf-8") as f:
         f.write("=" * 50 + "\n")
-        f.write("        8-PUZZLE SOLUTION - BEST-FIRST SEARCH\n")
+        f.write(f"        {size * size - 1}-PUZZLE SOLUTION - {ALGORITHM_NAMES[algorithm]}\n")
         f.write("=" * 50 + "\n\n")
         f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
         # Initial board
         f.write("INITIAL BOARD:\n")
-        f.write("-" * 13 + "\n")
-        for row in initial_board:
-            f.write("| " + " | ".join(str(x) if x != 0 else " " for x in row) + " |\n")
-        f.write("-" * 13 + "\n\n")
+        f.write(line + "\n")
+        f.writelines(board_rows(initial_board))
+        f.write(line + "\n\n")
 
         # Solution steps
         f.write(f"SOLUTION (Total Cost: {len(solution_steps) - 1} moves):\n\n")
 
         for step_num, board in enumerate(solution_steps):
             f.write(f"Step {step_num}:\n")
-            f.write("-" * 13 + "\n")
-            for row in board:
-                f.write(
-                    "| " + " | ".join(str(x) if x != 0 else " " for x in row) + " |\n"
-                )
-            f.write("-" * 13 + "\n\n")
+            f.write(line + "\n")
+            f.writelines(board_rows(board))
+            f.write(line + "\n\n")
 
         f.write("=" * 50 + "\n")
         f.write(f"GOAL REACHED IN {len(solution_steps) - 1} MOVES!\n")
@@ -171,8 +400,94 @@ def save_solution_file(initial_board, solution_steps):
 
 @app.route("/generate", methods=["GET"])
 def generate():
-    board = generate_random_puzzle()
-    return jsonify({"board": board, "message": "Random puzzle generated successfully"})
+    """
+    Query string: size (3, 4 or 5), depth (exact optimal moves, 3x3 only) or difficulty (easy, medium or hard, 3x3 only) or moves (random walk length), and count for many boards at once.
+    """
+
+    size = request.args.get("size", SIZE, type=int)
+    if size not in SUPPORTED_SIZES:
+        return jsonify({"error": f"size must be one of {list(SUPPORTED_SIZES)}"}), 400
+
+    count = request.args.get("count", type=int)
+    if count is not None and not 1 <= count <= MAX_GENERATE_COUNT:
+        return jsonify({"error": f"count must be between 1 and {MAX_GENERATE_COUNT}"}), 400
+
+    depth = request.args.get("depth", type=int)
+    difficulty = request.args.get("difficulty")
+    moves = request.args.get("moves", type=int)
+    if sum(option is not None for option in (depth, difficulty, moves)) > 1:
+        return jsonify({"error": "Use only one of depth, difficulty and moves"}), 400
+    if (depth is not None or difficulty is not None) and size != SIZE:
+        return jsonify({"error": "depth and difficulty need the distance table, which only covers 3x3 boards"}), 400
+    if depth is not None:
+        if not 0 <= depth <= MAX_DEPTH:
+            return jsonify({"error": f"depth must be between 0 and {MAX_DEPTH}"}), 400
+        depth = (depth, depth)
+    if difficulty is not None:
+        if difficulty not in DIFFICULTIES:
+            return jsonify({"error": f"difficulty must be one of {list(DIFFICULTIES)}"}), 400
+        depth = DIFFICULTIES[difficulty]
+    if moves is not None and not 0 <= moves <= MAX_SCRAMBLE_MOVES:
+        return jsonify({"error": f"moves must be between 0 and {MAX_SCRAMBLE_MOVES}"}), 400
+    if moves is not None and moves * (count or 1) > MAX_SCRAMBLE_TOTAL:
+        return jsonify({"error": f"count * moves must be at most {MAX_SCRAMBLE_TOTAL}"}), 400
+
+    boards = [generate_random_puzzle(size, depth, moves) for _ in range(count or 1)]
+
+    # Exact optimal distance of every 3x3 board, a single table read each
+    optimal = None
+    if size == SIZE:
+        optimal = [DISTANCE_TABLE[state_index(encode_board(board)[0])] for board in boards]
+
+    if count is None:
+        return jsonify(
+            {
+                "board": boards[0],
+                "optimal_moves": optimal[0] if optimal else None,
+                "message": "Random puzzle generated successfully",
+            }
+        )
+    return jsonify(
+        {
+            "boards": boards,
+            "optimal_moves": optimal,
+            "message": f"{len(boards)} random puzzles generated successfully",
+        }
+    )
+
+
+@app.route("/health", methods=["GET"])
+def health():
+    # For load balancers and gunicorn's workers: cheap, never touches the search
+    return jsonify(
+        {
+            "status": "ok",
+            "pid": os.getpid(),
+            "heuristics": {size: sorted(get_heuristics(size)) for size in SUPPORTED_SIZES},
+            "max_seconds": MAX_SECONDS,
+        }
+    )
+
+
+@app.route("/stats", methods=["GET"])
+def stats():
+    return jsonify({"cache": SOLUTION_CACHE.stats(), "suffix_cache": SUFFIX_CACHE.stats()})
+
+
+@app.route("/validate", methods=["POST"])
+def validate():
+    # Lets the frontend check a board without paying for a solve
+    data = read_json_body()
+    if data is None:
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+    board = data.get("board")
+
+    error = "Board is required" if board is None else board_error(board)
+    if error:
+        return jsonify({"valid": False, "solvable": False, "error": error})
+
+    puzzle = get_puzzle(len(board))
+    return jsonify({"valid": True, "solvable": puzzle.is_solvable(puzzle.encode_board(board)[0])})
 
 
 @app.route("/solve", methods=["POST"])
@@ -180,29 +495,60 @@ def solve():
     try:
 
         # Get the board from the request body
-        data = request.get_json()
+        data = read_json_body()
+        if data is None:
+            return jsonify({"error": "Request body must be a JSON object"}), 400
         board = data.get("board")
 
         # Validate the input board
         if not board:
             return jsonify({"error": "Board is required"}), 400
 
-        print("[Backend] Solving puzzle...")
-        solution_steps = best_first_search(board)
+        options, error = read_solve_options(data)
+        if error:
+            return jsonify({"error": error}), 400
+        algorithm, heuristic = options["algorithm"], options["heuristic"]
+
+        error = board_problem(board, options)
+        if error:
+            return jsonify({"error": error}), 422
+
+        print(f"[Backend] Solving {len(board)}x{len(board)} puzzle with {algorithm}...")
+        try:
+            solution_steps, nodes_expanded, cached = cached_solve(board, **options)
+        except SearchLimitExceeded as e:
+            print(f"[Backend] {e}")
+            return (
+                jsonify({"error": str(e), "max_nodes": e.max_nodes, "max_seconds": e.max_seconds}),
+                503,
+            )
 
         if solution_steps is None:
             return jsonify({"error": "No solution found"}), 500
 
-        # Save to file
-        save_solution_file(board, solution_steps)
         print(f"[Backend] Solution found! Cost: {len(solution_steps) - 1} moves")
 
+        # Optionally write the report in the background, the response does not wait for it
+        save_file = data.get("save_file", SAVE_SOLUTIONS)
+        solution_file = None
+        if save_file:
+            solution_file = queue_solution_file(board, solution_steps, algorithm)
+
         return jsonify(
             {
                 "initial_board": board,
                 "steps": solution_steps,
                 "total_cost": len(solution_steps) - 1,
-                "message": "Solution saved to solution.txt",
+                "algorithm": algorithm,
+                "heuristic": heuristic,
+                "nodes_expanded": nodes_expanded,
+                "cached": cached,
+                "solution_file": solution_file,
+                "message": (
+                    f"Solution will be saved to {os.path.basename(solution_file)}"
+                    if solution_file
+                    else "Solution found"
+                ),
             }
         )
 
@@ -211,6 +557,146 @@ def solve():
         return jsonify({"error": "An error occurred while solving the puzzle"}), 500
 
 
+@app.route("/solve/batch", methods=["POST"])
+def solve_batch():
+    try:
+        data = read_json_body()
+        if data is None:
+            return jsonify({"error": "Request body must be a JSON object"}), 400
+        boards = data.get("boards")
+
+        if not isinstance(boards, list) or not boards:
+            return jsonify({"error": "boards must be a non-empty list"}), 400
+        if len(boards) > MAX_BATCH_SIZE:
+            return jsonify({"error": f"At most {MAX_BATCH_SIZE} boards per batch"}), 400
+
+        options, error = read_solve_options(data)
+        if error:
+            return jsonify({"error": error}), 400
+
+        print(f"[Backend] Solving batch of {len(boards)} boards with {options['algorithm']}...")
+        start = time.perf_counter()
+
+        # map() keeps the results in the same order as the boards. max_seconds is the budget
+        # of the whole batch, not of every board
+        deadline = time.time() + options["max_seconds"]
+        tasks = [(board, options, deadline) for board in boards]
+        chunksize = max(1, len(tasks) // (BATCH_WORKERS * 4))
+        results = list(get_batch_executor().map(solve_task, tasks, chunksize=chunksize))
+
+        return jsonify(
+            {
+                "results": results,
+                "algorithm": options["algorithm"],
+                "heuristic": options["heuristic"],
+                "workers": BATCH_WORKERS,
+                "total_time_ms": round((time.perf_counter() - start) * 1000, 3),
+            }
+        )
+
+    except Exception as e:
+        print(f"[Backend] Error: {str(e)}")
+        return jsonify({"error": "An error occurred while solving the batch"}), 500
+
+
+def stream_solution(board, options, encoding):
+    """
+    Generator behind /solve/stream. The search runs in a separate thread and reports progress through a queue, so progress events can be sent while it is still running. Once it finishes, the solution header is sent followed by the steps one per event (or a single move string if encoding is "moves").
+    """
+
+    events = queue.Queue()
+    puzzle = get_puzzle(len(board))
+    start_state, start_blank = puzzle.encode_board(board)
+
+    def run():
+        try:
+            path, expanded = solve_packed(
+                start_state,
+                start_blank,
+                options["algorithm"],
+                options["heuristic"],
+                options["max_nodes"],
+                lambda nodes, frontier: events.put(
+                    {"type": "progress", "nodes_expanded": nodes, "frontier_size": frontier}
+                ),
+                options["max_seconds"],
+                puzzle.size,
+            )
+            events.put({"type": "result", "path": path, "nodes_expanded": expanded})
+        except SearchLimitExceeded as e:
+            events.put({"type": "error", "error": str(e)})
+        except Exception as e:
+            print(f"[Backend] Error: {str(e)}")
+            events.put({"type": "error", "error": "An error occurred while solving the puzzle"})
+
+    threading.Thread(target=run, daemon=True).start()
+
+    while True:
+        event = events.get()
+        if event["type"] == "progress":
+            yield event
+            continue
+        if event["type"] == "error":
+            yield event
+            return
+
+        path = event["path"]
+        if path is None:
+            yield {"type": "error", "error": "No solution found"}
+            return
+
+        yield {
+            "type": "solution",
+            "total_cost": len(path) - 1,
+            "algorithm": options["algorithm"],
+            "heuristic": options["heuristic"],
+            "nodes_expanded": event["nodes_expanded"],
+        }
+        if encoding == "moves":
+            yield {"type": "moves", "moves": puzzle.path_to_moves(path)}
+        else:
+            for index, state in enumerate(path):
+                yield {"type": "step", "index": index, "board": puzzle.decode_board(state)}
+        yield {"type": "done"}
+        return
+
+
+@app.route("/solve/stream", methods=["POST"])
+def solve_stream():
+    """
+    Streaming variant of /solve. Sends newline-delimited JSON by default, or Server-Sent Events with ?format=sse. Send "encoding": "moves" to get the path as a move string ("U", "D", "L", "R" for the direction the empty tile moves) instead of one board per step.
+    """
+
+    data = read_json_body()
+    if data is None:
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+    board = data.get("board")
+
+    if not board:
+        return jsonify({"error": "Board is required"}), 400
+
+    options, error = read_solve_options(data)
+    if error:
+        return jsonify({"error": error}), 400
+
+    error = board_problem(board, options)
+    if error:
+        return jsonify({"error": error}), 422
+
+    encoding = data.get("encoding", "boards")
+    if encoding not in ("boards", "moves"):
+        return jsonify({"error": "encoding must be 'boards' or 'moves'"}), 400
+
+    events = stream_solution(board, options, encoding)
+    if request.args.get("format") == "sse":
+        body = (f"event: {e['type']}\ndata: {json.dumps(e)}\n\n" for e in events)
+        return Response(body, mimetype="text/event-stream")
+
+    body = (json.dumps(e) + "\n" for e in events)
+    return Response(body, mimetype="application/x-ndjson")
+
+
+# Development server only, see wsgi.py and gunicorn.conf.py for serving real traffic
 if __name__ == "__main__":
     print("Flask app is running on http://localhost:3500")
     app.run(debug=True, port=3500)
@@ -0,0 +1,111 @@
+"""
+Load test for the puzzle backend. Sends /solve requests with random boards from a
+number of concurrent clients and reports requests per second and latency.
+
+    gunicorn -c gunicorn.conf.py wsgi:app                      # in one terminal
+    python load_test.py --concurrency 1,2,4,8 --duration 10    # in another
+
+Run it against servers started with different PUZZLE_WORKERS to see how throughput
+scales with workers. Only the standard library is used, so it runs anywhere.
+"""
+
+import argparse
+import json
+import random
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from puzzle import GOAL_BLANK, GOAL_STATE, decode_board, expand
+
+
+def random_board(rng, steps):
+    # Random walk from the goal, so every board is solvable
+    state, blank = GOAL_STATE, GOAL_BLANK
+    for _ in range(steps):
+        state, blank, _ = rng.choice(list(expand(state, blank)))
+    return decode_board(state)
+
+
+def post(url, body, timeout):
+    request = urllib.request.Request(
+        url, data=json.dumps(body).encode(), headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        response.read()
+        return response.status
+
+
+def client(url, body, deadline, seed, steps, timeout):
+    # One simulated user: send requests back to back until the deadline
+    rng = random.Random(seed)
+    latencies, errors = [], 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            post(url, dict(body, board=random_board(rng, steps)), timeout)
+            latencies.append(time.perf_counter() - start)
+        except (urllib.error.URLError, OSError):
+            errors += 1
+    return latencies, errors
+
+
+def run(url, body, concurrency, duration, steps, timeout):
+    deadline = time.perf_counter() + duration
+    with ThreadPoolExecutor(concurrency) as pool:
+        futures = [pool.submit(client, url, body, deadline, i, steps, timeout) for i in range(concurrency)]
+        results = [f.result() for f in futures]
+
+    latencies = sorted(latency for result in results for latency in result[0])
+    errors = sum(result[1] for result in results)
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_second": round(len(latencies) / duration, 1),
+        "p50_ms": round(percentile(0.50), 1),
+        "p95_ms": round(percentile(0.95), 1),
+        "p99_ms": round(percentile(0.99), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the puzzle backend")
+    parser.add_argument("--url", default="http://localhost:3500")
+    parser.add_argument("--concurrency", default="1,2,4,8", help="Comma separated client counts to try")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per concurrency level")
+    parser.add_argument("--algorithm", default="astar")
+    parser.add_argument("--heuristic", default="manhattan")
+    parser.add_argument("--steps", type=int, default=60, help="Random walk length of the boards")
+    parser.add_argument("--timeout", type=float, default=60, help="Client timeout per request in seconds")
+    parser.add_argument("--output", help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    url = args.url.rstrip("/") + "/solve"
+    body = {"algorithm": args.algorithm, "heuristic": args.heuristic}
+
+    with urllib.request.urlopen(args.url.rstrip("/") + "/health", timeout=args.timeout) as response:
+        print(f"Server healthy: {response.read().decode()}")
+
+    results = []
+    print(f"{'clients':>8} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for concurrency in (int(c) for c in args.concurrency.split(",")):
+        r = run(url, body, concurrency, args.duration, args.steps, args.timeout)
+        results.append(r)
+        print(
+            f"{r['concurrency']:>8} {r['requests']:>9} {r['errors']:>7} {r['requests_per_second']:>8} "
+            f"{r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Disjoint additive pattern databases for sliding puzzles.
+
+The tiles are split into disjoint groups. For every group, a table stores the exact
+number of moves of that group's tiles needed to bring them home from any placement,
+ignoring all other tiles. Because only moves of the group's own tiles are counted,
+the values of all groups can be added and the sum is still an admissible heuristic.
+
+Tables are built offline and saved to one binary file:
+
+    python pattern_db.py --size 3 --output pdb_3x3.bin
+    python pattern_db.py --size 4 --output pdb_4x4.bin   # takes a while
+
+File layout (little endian):
+    b"PDB1", board size (u8), number of groups (u8)
+    for every group: tile count (u8), the tiles (u8 each), table length (u32)
+    followed by all tables back to back, one byte per entry
+
+load_pattern_db() maps the file with mmap, so the tables are never copied into the
+process: every worker that opens the same file shares the page cache.
+"""
+
+import argparse
+import struct
+from collections import deque
+
+from puzzle import neighbor_table
+from table_file import atomic_write, map_table
+
+MAGIC = b"PDB1"
+UNSEEN = 255
+
+# Default tile groups per board size
+DEFAULT_GROUPS = {
+    3: [(1, 2, 3, 4), (5, 6, 7, 8)],
+    4: [(1, 2, 3, 4, 5), (6, 7, 8, 9, 10), (11, 12, 13, 14, 15)],
+}
+
+
+def goal_index(tile, size):
+    # Goal cell of a tile: 1..n-1 in order, empty tile in the last cell
+    return size * size - 1 if tile == 0 else tile - 1
+
+
+def table_length(group_size, cells):
+    # Number of ordered placements of group_size distinct tiles on the board
+    length = 1
+    for i in range(group_size):
+        length *= cells - i
+    return length
+
+
+def rank_positions(positions, cells):
+    # Index of an ordered selection of distinct cells among the cells!/(cells-k)! possible ones
+    rank = 0
+    for i, pos in enumerate(positions):
+        smaller = 0
+        for p in positions[:i]:
+            if p < pos:
+                smaller += 1
+        rank = rank * (cells - i) + (pos - smaller)
+    return rank
+
+
+def unrank_positions(rank, group_size, cells):
+    # Inverse of rank_positions
+    digits = []
+    for i in reversed(range(group_size)):
+        rank, digit = divmod(rank, cells - i)
+        digits.append(digit)
+    digits.reverse()
+
+    free = list(range(cells))
+    return tuple(free.pop(digit) for digit in digits)
+
+
+def build_pattern_table(tiles, size):
+    """
+    Build the table for one group with a 0-1 BFS backwards from the goal over (placement of the group, empty cell). Moving a tile of the group costs 1, moving any other tile costs 0. Every abstract node is stored as the integer rank * cells + blank so the search only keeps ints and two bytearrays in memory.
+    """
+
+    cells = size * size
+    neighbors = neighbor_table(size)
+    length = table_length(len(tiles), cells)
+
+    table = bytearray([UNSEEN]) * length
+    seen = bytearray([UNSEEN]) * (length * cells)
+
+    start = rank_positions([goal_index(t, size) for t in tiles], cells) * cells + goal_index(0, size)
+    seen[start] = 0
+    queue = deque([start])
+
+    while queue:
+        node = queue.popleft()
+        cost = seen[node]
+        rank, blank = divmod(node, cells)
+
+        if cost < table[rank]:
+            table[rank] = cost
+
+        positions = unrank_positions(rank, len(tiles), cells)
+        for target in neighbors[blank]:
+            if target in positions:
+                moved = [blank if p == target else p for p in positions]
+                next_node = rank_positions(moved, cells) * cells + target
+                if cost + 1 < seen[next_node]:
+                    seen[next_node] = cost + 1
+                    queue.append(next_node)
+            else:
+                next_node = rank * cells + target
+                if cost < seen[next_node]:
+                    seen[next_node] = cost
+                    queue.appendleft(next_node)
+
+    return table
+
+
+def write_pattern_db(path, size, groups):
+    tables = [build_pattern_table(group, size) for group in groups]
+
+    chunks = [MAGIC + struct.pack("<BB", size, len(groups))]
+    for group, table in zip(groups, tables):
+        chunks.append(struct.pack("<B", len(group)) + bytes(group) + struct.pack("<I", len(table)))
+    atomic_write(path, chunks + tables)
+
+
+class PatternDatabase:
+    """A set of disjoint pattern tables, usually backed by a memory-mapped file."""
+
+    def __init__(self, size, groups, tables, mapping=None):
+        self.size = size
+        self.cells = size * size
+        self.groups = groups
+        self.tables = tables
+        self._mapping = mapping  # Keeps the mmap alive as long as the tables are used
+
+    def estimate(self, where):
+        """
+        Heuristic value for a board given as where[tile] = cell index of the tile. Each group is one table lookup.
+        """
+
+        total = 0
+        for group, table in zip(self.groups, self.tables):
+            total += table[rank_positions([where[t] for t in group], self.cells)]
+        return total
+
+
+def load_pattern_db(path):
+    mapping = map_table(path, lambda mapping: mapping[:4] == MAGIC, "a pattern database file")
+
+    size, group_count = struct.unpack_from("<BB", mapping, 4)
+    offset = 6
+    groups, lengths = [], []
+    for _ in range(group_count):
+        (tile_count,) = struct.unpack_from("<B", mapping, offset)
+        groups.append(tuple(mapping[offset + 1 : offset + 1 + tile_count]))
+        (length,) = struct.unpack_from("<I", mapping, offset + 1 + tile_count)
+        lengths.append(length)
+        offset += 1 + tile_count + 4
+
+    # Zero-copy views into the mapped file, indexing them reads the page cache directly
+    view = memoryview(mapping)
+    tables = []
+    for length in lengths:
+        tables.append(view[offset : offset + length])
+        offset += length
+
+    return PatternDatabase(size, groups, tables, mapping)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build additive pattern databases")
+    parser.add_argument("--size", type=int, default=3, choices=sorted(DEFAULT_GROUPS))
+    parser.add_argument("--output", help="Output file (default: pdb_<size>x<size>.bin)")
+    args = parser.parse_args()
+
+    output = args.output or f"pdb_{args.size}x{args.size}.bin"
+    print(f"Building pattern databases for {args.size}x{args.size}...")
+    write_pattern_db(output, args.size, DEFAULT_GROUPS[args.size])
+    print(f"Saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Packed board representation for the 8-puzzle.
+
+The search code never works with nested lists. A board is packed into a single
+integer where cell i (row-major, 0..8) is stored in bits 4*i .. 4*i+3, and the
+index of the empty tile is carried next to it so it never has to be searched for.
+Lists of lists are only used at the API boundary (see encode_board / decode_board).
+
+The module-level functions are the 3x3 fast path used by the 8-puzzle. Bigger boards
+(15- and 24-puzzle) use a SlidingPuzzle object from get_puzzle(size), which has the same
+functions as methods and packs cells into 4 or 5 bits each depending on the size.
+"""
+
+import random
+from math import factorial
+
+from ranking import unrank_permutation
+
+SIZE = 3  # Board is SIZE x SIZE
+CELLS = SIZE * SIZE
+BITS = 4  # Bits used per cell (tiles 0..8 fit in 4 bits)
+MASK = (1 << BITS) - 1
+
+GOAL_BOARD = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+SUPPORTED_SIZES = (3, 4, 5)
+
+
+def encode_board(board):
+    """
+    Pack a list-of-lists board into (state, blank) where state is the packed integer and blank is the index (0..8) of the empty tile.
+    """
+
+    state = 0
+    blank = None
+
+    for i, tile in enumerate(tile for row in board for tile in row):
+        state |= tile << (BITS * i)
+        if tile == 0:
+            blank = i
+
+    return state, blank
+
+
+def board_error(board):
+    """
+    Check that board is a square list of lists of a supported size (3x3, 4x4 or 5x5) holding each of the numbers 0..n-1 exactly once. Returns a message describing the first problem found, or None if the board is well formed.
+    """
+
+    if not isinstance(board, list) or len(board) not in SUPPORTED_SIZES:
+        return f"Board must be a list of {' or '.join(map(str, SUPPORTED_SIZES))} rows"
+    size = len(board)
+    for row in board:
+        if not isinstance(row, list) or len(row) != size:
+            return f"Every row must be a list of {size} numbers"
+        for tile in row:
+            if type(tile) is not int:
+                return "Tiles must be integers"
+
+    tiles = sorted(tile for row in board for tile in row)
+    if tiles != list(range(size * size)):
+        return f"Board must contain each number from 0 to {size * size - 1} exactly once"
+
+    return None
+
+
+def decode_board(state):
+    # Unpack the integer back into the list-of-lists shape used by the API
+    tiles = [(state >> (BITS * i)) & MASK for i in range(CELLS)]
+    return [tiles[r * SIZE : (r + 1) * SIZE] for r in range(SIZE)]
+
+
+GOAL_STATE, GOAL_BLANK = encode_board(GOAL_BOARD)
+
+
+def neighbor_table(size):
+    # For every blank position, the cell indices the blank can swap with (up, down, left, right)
+    neighbors = []
+    for index in range(size * size):
+        row, col = divmod(index, size)
+        cells = []
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            new_row, new_col = row + dr, col + dc
+            if 0 <= new_row < size and 0 <= new_col < size:
+                cells.append(new_row * size + new_col)
+        neighbors.append(tuple(cells))
+    return tuple(neighbors)
+
+
+def manhattan_table(size):
+    # table[tile][index] = distance of `tile` at `index` from its goal cell (0 for the empty tile)
+    cells = size * size
+    table = []
+    for tile in range(cells):
+        goal_row, goal_col = divmod((tile - 1) % cells, size)
+        distances = []
+        for index in range(cells):
+            row, col = divmod(index, size)
+            distances.append(0 if tile == 0 else abs(row - goal_row) + abs(col - goal_col))
+        table.append(tuple(distances))
+    return tuple(table)
+
+
+NEIGHBORS = neighbor_table(SIZE)
+MANHATTAN = manhattan_table(SIZE)
+
+
+def expand(state, blank):
+    # Every (next_state, next_blank, moved_tile) reachable with one move of the empty tile
+    for target in NEIGHBORS[blank]:
+        tile = (state >> (BITS * target)) & MASK
+        yield state - (tile << (BITS * target)) + (tile << (BITS * blank)), target, tile
+
+
+def manhattan(state):
+    # Sum of Manhattan distances of all tiles, read straight from the precomputed table
+    distance = 0
+    for index in range(CELLS):
+        distance += MANHATTAN[(state >> (BITS * index)) & MASK][index]
+    return distance
+
+
+class SlidingPuzzle:
+    """
+    Packed-state helpers for an N x N board, with the same names as the 3x3 functions above. All tables (neighbours, Manhattan distances) are built once per size.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.cells = size * size
+        self.bits = max(4, (self.cells - 1).bit_length())  # 4 bits up to 4x4, 5 bits for 5x5
+        self.mask = (1 << self.bits) - 1
+        self.goal_board = [[(r * size + c + 1) % self.cells for c in range(size)] for r in range(size)]
+        self.goal_state, self.goal_blank = self.encode_board(self.goal_board)
+        self.neighbors = neighbor_table(size)
+        self.manhattan_table = manhattan_table(size)
+        self.move_letters = {-size: "U", size: "D", -1: "L", 1: "R"}  # Direction the empty tile moves in
+
+    def encode_board(self, board):
+        state = 0
+        blank = None
+        for i, tile in enumerate(tile for row in board for tile in row):
+            state |= tile << (self.bits * i)
+            if tile == 0:
+                blank = i
+        return state, blank
+
+    def decode_board(self, state):
+        tiles = self.tiles(state)
+        return [tiles[r * self.size : (r + 1) * self.size] for r in range(self.size)]
+
+    def tiles(self, state):
+        return [(state >> (self.bits * i)) & self.mask for i in range(self.cells)]
+
+    def is_solvable(self, state):
+        """
+        On odd widths the tile order (ignoring the empty cell) must have an even number of inversions, like on 3x3. On even widths a vertical move jumps a tile over an odd number of tiles, so the parity of inversions plus the row of the empty cell (counted from the bottom) is what stays fixed, and it has to be odd as in the goal.
+        """
+
+        tiles = self.tiles(state)
+        blank_row = tiles.index(0) // self.size
+        tiles = [tile for tile in tiles if tile]
+
+        inversions = 0
+        for i in range(len(tiles)):
+            for j in range(i + 1, len(tiles)):
+                if tiles[j] < tiles[i]:
+                    inversions += 1
+
+        if self.size % 2:
+            return inversions % 2 == 0
+        return (inversions + self.size - blank_row) % 2 == 1
+
+    def random_state(self, rng=random):
+        """
+        Uniformly random solvable board as (state, blank). A random permutation is unranked from a random rank; if it is unsolvable, swapping the first two tiles (not the empty cell) flips the inversion parity without moving the empty cell, which maps the unsolvable half one-to-one onto the solvable half, so every solvable board is equally likely.
+        """
+
+        tiles = unrank_permutation(rng.randrange(factorial(self.cells)), self.cells)
+        state, blank = self.encode_board([tiles])
+        if not self.is_solvable(state):
+            first, second = [i for i, tile in enumerate(tiles) if tile][:2]
+            tiles[first], tiles[second] = tiles[second], tiles[first]
+            state, blank = self.encode_board([tiles])
+        return state, blank
+
+    def random_walk(self, moves, rng=random):
+        # Scramble the goal with `moves` random moves, cheap but biased towards shallow boards
+        state, blank = self.goal_state, self.goal_blank
+        for _ in range(moves):
+            state, blank, _ = rng.choice(list(self.expand(state, blank)))
+        return state, blank
+
+    def expand(self, state, blank):
+        bits, mask = self.bits, self.mask
+        for target in self.neighbors[blank]:
+            tile = (state >> (bits * target)) & mask
+            yield state - (tile << (bits * target)) + (tile << (bits * blank)), target, tile
+
+    def manhattan(self, state):
+        bits, mask, table = self.bits, self.mask, self.manhattan_table
+        distance = 0
+        for index in range(self.cells):
+            distance += table[(state >> (bits * index)) & mask][index]
+        return distance
+
+    def path_to_moves(self, path):
+        blanks = [self.tiles(state).index(0) for state in path]
+        return "".join(self.move_letters[b - a] for a, b in zip(blanks, blanks[1:]))
+
+
+_puzzles = {}
+
+
+def get_puzzle(size):
+    # One shared SlidingPuzzle per board size, its tables are built on first use
+    if size not in _puzzles:
+        _puzzles[size] = SlidingPuzzle(size)
+    return _puzzles[size]
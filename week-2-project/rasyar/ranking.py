@@ -0,0 +1,44 @@
+"""
+Ranking and unranking of permutations.
+
+rank_permutation maps a permutation of 0..n-1 to its position (0 .. n!-1) in
+lexicographic order and unrank_permutation does the reverse. Permutations whose
+ranks are 2k and 2k+1 only differ by a swap of the last two elements, so they
+always have opposite parity; this is what lets the puzzle tables store only the
+reachable half of the tile orders by using rank // 2 as the index.
+"""
+
+from math import factorial
+
+
+def rank_permutation(values):
+    # Lehmer code: for every position, how many later values are smaller
+    n = len(values)
+    rank = 0
+    for i in range(n):
+        smaller = 0
+        for j in range(i + 1, n):
+            if values[j] < values[i]:
+                smaller += 1
+        rank += smaller * factorial(n - 1 - i)
+    return rank
+
+
+def unrank_permutation(rank, n):
+    free = list(range(n))
+    values = []
+    for i in range(n):
+        digit, rank = divmod(rank, factorial(n - 1 - i))
+        values.append(free.pop(digit))
+    return values
+
+
+def permutation_parity(values):
+    # 0 for an even number of inversions, 1 for odd
+    inversions = 0
+    n = len(values)
+    for i in range(n):
+        for j in range(i + 1, n):
+            if values[j] < values[i]:
+                inversions += 1
+    return inversions & 1
@@ -0,0 +1,330 @@
+"""
+Search algorithms for sliding puzzles.
+
+All solvers share the move generator from puzzle.py and take any heuristic from
+heuristics.py. They work on packed states and return (path, nodes_expanded) where
+path is the list of packed states from start to goal, or None if there is no solution.
+By default they run on the 3x3 fast path; pass puzzle=get_puzzle(n) for bigger boards.
+
+Budgets: if a search expands more than max_nodes states, or runs longer than
+max_seconds, it raises SearchLimitExceeded. If a progress callback is given, it is
+called as progress(nodes_expanded, frontier_size) every PROGRESS_INTERVAL expansions
+(for IDA* the "frontier" is the current path).
+
+- greedy: best-first on h only, fast but the path is usually not the shortest
+- astar: best-first on g + h, optimal path
+- idastar: iterative deepening on g + h, optimal path with memory O(solution depth)
+- bidirectional: breadth-first from the start and the goal at once, meeting in the
+  middle; optimal path, ignores the heuristic (opt-in, compare with --benchmark)
+"""
+
+import argparse
+import heapq  # Priority queue implementation
+import random
+import time
+
+from puzzle import BITS, CELLS, GOAL_BLANK, GOAL_STATE, MASK, expand
+
+PROGRESS_INTERVAL = 1000
+
+
+class SearchLimitExceeded(Exception):
+    """Raised when a search expands more nodes or runs longer than its budget allows."""
+
+    def __init__(self, max_nodes=None, max_seconds=None):
+        if max_seconds is not None:
+            super().__init__(f"Search aborted after {max_seconds} seconds")
+        else:
+            super().__init__(f"Search aborted after expanding {max_nodes} nodes")
+        self.max_nodes = max_nodes
+        self.max_seconds = max_seconds
+
+
+def check_progress(expanded, frontier_size, deadline, max_seconds, progress):
+    # Called every PROGRESS_INTERVAL expansions: enforce the time budget and report progress
+    if deadline is not None and time.monotonic() > deadline:
+        raise SearchLimitExceeded(max_seconds=max_seconds)
+    if progress:
+        progress(expanded, frontier_size)
+
+
+def reconstruct_path(parents, state):
+    # Walk the parent pointers back from the goal and return the states from start to goal
+    path = []
+    while state is not None:
+        path.append(state)
+        state = parents[state]
+    path.reverse()
+    return path
+
+
+def greedy_search(
+    start_state, start_blank, heuristic, max_nodes, progress=None, max_seconds=None, puzzle=None
+):
+    goal_state, moves = (GOAL_STATE, expand) if puzzle is None else (puzzle.goal_state, puzzle.expand)
+    deadline = time.monotonic() + max_seconds if max_seconds else None
+
+    frontier = [(heuristic(start_state), start_state, start_blank)]
+
+    # Parent of every visited state, doubles as the visited set to avoid cycles
+    parents = {start_state: None}
+    expanded = 0
+
+    while frontier:
+        _, state, blank = heapq.heappop(frontier)
+
+        if state == goal_state:
+            return reconstruct_path(parents, state), expanded
+
+        expanded += 1
+        if expanded > max_nodes:
+            raise SearchLimitExceeded(max_nodes)
+        if expanded % PROGRESS_INTERVAL == 0:
+            check_progress(expanded, len(frontier), deadline, max_seconds, progress)
+
+        for next_state, next_blank, _ in moves(state, blank):
+            if next_state not in parents:
+                parents[next_state] = state
+                heapq.heappush(frontier, (heuristic(next_state), next_state, next_blank))
+
+    return None, expanded
+
+
+def astar_search(
+    start_state, start_blank, heuristic, max_nodes, progress=None, max_seconds=None, puzzle=None
+):
+    goal_state, moves = (GOAL_STATE, expand) if puzzle is None else (puzzle.goal_state, puzzle.expand)
+    deadline = time.monotonic() + max_seconds if max_seconds else None
+
+    # Heap entries are (f, -g, state, blank): ties on f go to the deeper node first
+    frontier = [(heuristic(start_state), 0, start_state, start_blank)]
+
+    parents = {start_state: None}
+    best_g = {start_state: 0}
+    expanded = 0
+
+    while frontier:
+        _, neg_g, state, blank = heapq.heappop(frontier)
+        g = -neg_g
+
+        if g > best_g[state]:
+            continue  # Stale entry, a shorter route to this state was found later
+
+        if state == goal_state:
+            return reconstruct_path(parents, state), expanded
+
+        expanded += 1
+        if expanded > max_nodes:
+            raise SearchLimitExceeded(max_nodes)
+        if expanded % PROGRESS_INTERVAL == 0:
+            check_progress(expanded, len(frontier), deadline, max_seconds, progress)
+
+        for next_state, next_blank, _ in moves(state, blank):
+            next_g = g + 1
+            if next_g < best_g.get(next_state, next_g + 1):
+                best_g[next_state] = next_g
+                parents[next_state] = state
+                heapq.heappush(
+                    frontier,
+                    (next_g + heuristic(next_state), -next_g, next_state, next_blank),
+                )
+
+    return None, expanded
+
+
+def idastar_search(
+    start_state, start_blank, heuristic, max_nodes, progress=None, max_seconds=None, puzzle=None
+):
+    """
+    IDA* keeps only the current path in memory. Each iteration is a depth-first search that cuts off any node whose g + h is above the threshold; the next threshold is the smallest f value that was cut off.
+    """
+
+    goal_state, moves = (GOAL_STATE, expand) if puzzle is None else (puzzle.goal_state, puzzle.expand)
+    deadline = time.monotonic() + max_seconds if max_seconds else None
+
+    path = [start_state]
+    on_path = {start_state}
+    expanded = 0
+
+    def dfs(state, blank, prev_blank, g, threshold):
+        nonlocal expanded
+
+        f = g + heuristic(state)
+        if f > threshold:
+            return f
+        if state == goal_state:
+            return True
+
+        expanded += 1
+        if expanded > max_nodes:
+            raise SearchLimitExceeded(max_nodes)
+        if expanded % PROGRESS_INTERVAL == 0:
+            check_progress(expanded, len(path), deadline, max_seconds, progress)
+
+        minimum = None
+        for next_state, next_blank, _ in moves(state, blank):
+            # Never undo the previous move or walk back onto the current path
+            if next_blank == prev_blank or next_state in on_path:
+                continue
+
+            path.append(next_state)
+            on_path.add(next_state)
+            result = dfs(next_state, next_blank, blank, g + 1, threshold)
+            if result is True:
+                return True
+            path.pop()
+            on_path.discard(next_state)
+
+            if result is not None and (minimum is None or result < minimum):
+                minimum = result
+
+        return minimum
+
+    threshold = heuristic(start_state)
+    while True:
+        result = dfs(start_state, start_blank, None, 0, threshold)
+        if result is True:
+            return path, expanded
+        if result is None:
+            return None, expanded  # Nothing was cut off, the whole space was searched
+        threshold = result
+
+
+def bidirectional_search(
+    start_state, start_blank, heuristic, max_nodes, progress=None, max_seconds=None, puzzle=None
+):
+    """
+    Breadth-first search from both ends. Every round expands one whole layer of the smaller frontier; a state already reached from the other side gives a path through it, and the shortest one found in that layer is optimal. With branching factor b and depth d this visits about 2 * b^(d/2) states instead of b^d. The heuristic is not used, it is only accepted so all solvers share one signature.
+    """
+
+    if puzzle is None:
+        goal_state, goal_blank, moves = GOAL_STATE, GOAL_BLANK, expand
+    else:
+        goal_state, goal_blank, moves = puzzle.goal_state, puzzle.goal_blank, puzzle.expand
+    deadline = time.monotonic() + max_seconds if max_seconds else None
+
+    if start_state == goal_state:
+        return [start_state], 0
+
+    # One parent map and one frontier layer per direction; a parent map doubles as the visited set
+    forward, backward = {start_state: None}, {goal_state: None}
+    forward_layer, backward_layer = [(start_state, start_blank)], [(goal_state, goal_blank)]
+    expanded = 0
+
+    while forward_layer and backward_layer:
+        from_start = len(forward_layer) <= len(backward_layer)
+        if from_start:
+            layer, parents, other = forward_layer, forward, backward
+        else:
+            layer, parents, other = backward_layer, backward, forward
+
+        next_layer = []
+        meeting = None
+        for state, blank in layer:
+            expanded += 1
+            if expanded > max_nodes:
+                raise SearchLimitExceeded(max_nodes)
+            if expanded % PROGRESS_INTERVAL == 0:
+                check_progress(expanded, len(layer) + len(next_layer), deadline, max_seconds, progress)
+
+            for next_state, next_blank, _ in moves(state, blank):
+                if next_state in parents:
+                    continue
+                parents[next_state] = state
+                next_layer.append((next_state, next_blank))
+                if meeting is None and next_state in other:
+                    meeting = next_state
+
+        if meeting is not None:
+            # Every state in a layer is at the same depth, so the first meeting is as short as any other
+            path = reconstruct_path(forward, meeting)
+            state = backward[meeting]
+            while state is not None:
+                path.append(state)
+                state = backward[state]
+            return path, expanded
+
+        if from_start:
+            forward_layer = next_layer
+        else:
+            backward_layer = next_layer
+
+    return None, expanded
+
+
+ALGORITHMS = {
+    "greedy": greedy_search,
+    "astar": astar_search,
+    "idastar": idastar_search,
+    "bidirectional": bidirectional_search,
+}
+
+
+def benchmark(count, seed=0):
+    """
+    Check bidirectional search against A* on `count` random 8-puzzle boards (same path length, every step a legal move) and print how many nodes each solver expands, with plain forward BFS as the baseline.
+    """
+
+    from heuristics import linear_conflict, manhattan  # Lazy import, heuristics imports puzzle tables
+
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        state, blank = GOAL_STATE, GOAL_BLANK
+        for _ in range(rng.randint(10, 80)):
+            state, blank, _ = rng.choice(list(expand(state, blank)))
+        boards.append((state, blank))
+
+    totals = {"bfs": 0, "bidirectional": 0, "astar (manhattan)": 0, "astar (linear conflict)": 0}
+    for state, blank in boards:
+        astar_path, astar_nodes = astar_search(state, blank, manhattan, 181_440)
+        path, nodes = bidirectional_search(state, blank, None, 181_440)
+        if path is None or len(path) != len(astar_path) or path[0] != state or path[-1] != GOAL_STATE:
+            raise AssertionError(f"bidirectional search disagrees with A* on {state:#x}")
+        for a, b in zip(path, path[1:]):
+            if b not in {s for s, _, _ in expand(a, blank_index(a))}:
+                raise AssertionError(f"bidirectional search returned an invalid move on {state:#x}")
+
+        totals["bfs"] += breadth_first_nodes(state, blank)
+        totals["bidirectional"] += nodes
+        totals["astar (manhattan)"] += astar_nodes
+        totals["astar (linear conflict)"] += astar_search(state, blank, linear_conflict, 181_440)[1]
+
+    print(f"{count} random boards, all bidirectional paths optimal")
+    for name, total in totals.items():
+        print(f"  {name:<24}: {total / count:10.1f} nodes expanded avg")
+
+
+def blank_index(state):
+    return next(i for i in range(CELLS) if not (state >> (BITS * i)) & MASK)
+
+
+def breadth_first_nodes(start_state, start_blank):
+    # Nodes a plain forward BFS expands before it reaches the goal, the baseline for the benchmark
+    parents = {start_state: None}
+    layer = [(start_state, start_blank)]
+    expanded = 0
+    while layer:
+        next_layer = []
+        for state, blank in layer:
+            if state == GOAL_STATE:
+                return expanded
+            expanded += 1
+            for next_state, next_blank, _ in expand(state, blank):
+                if next_state not in parents:
+                    parents[next_state] = state
+                    next_layer.append((next_state, next_blank))
+        layer = next_layer
+    return expanded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare bidirectional search with A* and BFS")
+    parser.add_argument("--benchmark", type=int, default=100, metavar="N", help="Number of random boards")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    benchmark(args.benchmark, args.seed)
+
+
+if __name__ == "__main__":
+    main()
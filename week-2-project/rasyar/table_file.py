@@ -0,0 +1,39 @@
+"""
+Reading and writing the precomputed table files (pattern databases, distance table).
+
+Tables are built when a server starts and finds the file missing, so several processes
+may do it at once. atomic_write writes to a temporary file next to the target and
+renames it into place, which means a reader only ever sees no file or a complete one.
+map_table maps a file read-only, so every process that opens it shares the page cache.
+"""
+
+import mmap
+import os
+import tempfile
+
+
+def atomic_write(path, chunks):
+    # Write every bytes-like chunk in order, then replace path in one step
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.chmod(temp_path, 0o644)  # mkstemp creates the file private to the owner
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def map_table(path, is_valid, description):
+    """
+    Memory-map the file at path read-only. Raises ValueError("<path> is not <description>") if is_valid(mapping) is false.
+    """
+
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if not is_valid(mapping):
+        mapping.close()
+        raise ValueError(f"{path} is not {description}")
+    return mapping
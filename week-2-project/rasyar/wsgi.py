@@ -0,0 +1,34 @@
+"""
+Production entry point for the puzzle backend.
+
+Linux / macOS, one process per core (settings in gunicorn.conf.py):
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Windows, or anywhere gunicorn is not available, one process with a thread pool:
+
+    python wsgi.py
+
+Importing this module imports index.py, which loads the pattern databases, the distance
+table and every heuristic table. Gunicorn does that once in the master (preload_app) and
+forks the workers afterwards, so they all share those tables copy-on-write.
+"""
+
+import os
+
+from index import app
+
+try:
+    from waitress import serve  # Optional, only needed for `python wsgi.py`
+except ImportError:
+    serve = None
+
+
+if __name__ == "__main__":
+    if serve is None:
+        raise SystemExit("waitress is not installed: pip install waitress (or use gunicorn -c gunicorn.conf.py wsgi:app)")
+
+    port = int(os.environ.get("PORT", 3500))
+    threads = int(os.environ.get("PUZZLE_THREADS", 8))
+    print(f"[Backend] Serving on http://0.0.0.0:{port} with {threads} threads")
+    serve(app, host="0.0.0.0", port=port, threads=threads)